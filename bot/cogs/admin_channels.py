@@ -57,6 +57,12 @@ class AdminChannels(commands.Cog):
             logger.error(f"Failed to check premium access: {e}")
             return False
     
+    def _invalidate_guild_cache(self, guild_id: int):
+        """Make the log parser re-read channel config on its next update"""
+        parser = getattr(self.bot, 'unified_log_parser', None)
+        if parser:
+            parser.invalidate_guild_cache(guild_id)
+    
     @discord.slash_command(name="setchannel", description="Configure output channels for the bot")
     @discord.default_permissions(administrator=True)
     async def set_channel(self, ctx,
@@ -127,6 +133,7 @@ class AdminChannels(commands.Cog):
                 },
                 upsert=True
             )
+            self._invalidate_guild_cache(guild_id)
             
             # Create success embed
             embed = discord.Embed(
@@ -276,6 +283,7 @@ class AdminChannels(commands.Cog):
                 {"$set": channel_updates},
                 upsert=True
             )
+            self._invalidate_guild_cache(guild_id)
             
             # Create success embed
             embed = discord.Embed(
@@ -338,6 +346,7 @@ class AdminChannels(commands.Cog):
                 {"guild_id": guild_id},
                 {"$set": clear_update}
             )
+            self._invalidate_guild_cache(guild_id)
             
             # Create confirmation embed
             embed = discord.Embed(
@@ -556,22 +556,8 @@ class Parsers(commands.Cog):
             guild_id = ctx.guild.id
             
             # Reset file states (forces cold start)
-            if hasattr(parser, 'reset_parser_state'):
-                parser.reset_parser_state()
-            else:
-                # Manual reset if method doesn't exist
-                parser.file_states.clear()
-                parser.player_sessions.clear()
-                parser.player_lifecycle.clear()
-                parser.last_log_position.clear()
-                if hasattr(parser, 'log_file_hashes'):
-                    parser.log_file_hashes.clear()
-                if hasattr(parser, 'server_status'):
-                    parser.server_status.clear()
+            parser.reset_parser_state()
             
-            # Update voice channels to reflect reset counts (0 players)
-            await parser.update_voice_channel(str(guild_id))
-
             # Trigger immediate cold start
             try:
                 await parser.run_log_parser()
@@ -614,6 +600,10 @@ class Parsers(commands.Cog):
                     inline=False
                 )
 
+            # Show the rebuilt counts - renaming to 0 before the cold start would spend
+            # one of the channel's few renames on a value that is replaced right away
+            await parser.update_voice_channel(str(guild_id))
+
             await ctx.followup.send(embed=embed)
 
         except Exception as e:
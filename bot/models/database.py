@@ -46,14 +46,18 @@ class DatabaseManager:
             # Player indexes (guild-scoped)
             await self.players.create_index([("guild_id", 1), ("discord_id", 1)], unique=True)
             await self.players.create_index([("guild_id", 1), ("linked_characters", 1)])
+            await self.players.create_index([("guild_id", 1), ("player_id", 1)])
 
             # PvP data indexes (server-scoped)
             await self.pvp_data.create_index([("guild_id", 1), ("server_id", 1), ("player_name", 1)], unique=True)
             await self.pvp_data.create_index([("guild_id", 1), ("server_id", 1), ("kills", -1)])
             await self.pvp_data.create_index([("guild_id", 1), ("server_id", 1), ("kdr", -1)])
+            await self.pvp_data.create_index([("guild_id", 1), ("player_id", 1)])
+            await self.pvp_data.create_index([("guild_id", 1), ("last_updated", -1)])
 
             # Kill events indexes (server-scoped)
             await self.kill_events.create_index([("guild_id", 1), ("server_id", 1), ("timestamp", -1)])
+            await self.kill_events.create_index([("guild_id", 1), ("timestamp", -1)])
             await self.kill_events.create_index([("guild_id", 1), ("server_id", 1), ("killer", 1)])
             await self.kill_events.create_index([("guild_id", 1), ("server_id", 1), ("victim", 1)])
 
@@ -90,6 +94,14 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Failed to create database indexes: {e}")
 
+        try:
+            # Name lookup indexes, hinted by the parser's kill-name queries, so a
+            # failure elsewhere above must not leave them missing
+            await self.kill_events.create_index([("guild_id", 1), ("killer_id", 1), ("timestamp", -1), ("killer", 1)])
+            await self.kill_events.create_index([("guild_id", 1), ("victim_id", 1), ("timestamp", -1), ("victim", 1)])
+        except Exception as e:
+            logger.error(f"Failed to create kill name lookup indexes: {e}")
+
     # GUILD MANAGEMENT
     async def create_guild(self, guild_id: int, guild_name: str) -> Dict[str, Any]:
         """Create guild configuration"""
@@ -463,11 +475,16 @@ class DatabaseManager:
             
             # Ensure distance is within reasonable bounds
             distance = max(0.0, min(distance, 5000.0))
+
+            # Store a BSON date so timestamp range queries hit the indexes
+            timestamp = kill_data.get("timestamp")
+            if not isinstance(timestamp, datetime):
+                timestamp = datetime.now(timezone.utc)
             
             kill_event = {
                 "guild_id": guild_id,
                 "server_id": server_id,
-                "timestamp": kill_data.get("timestamp", datetime.now(timezone.utc)),
+                "timestamp": timestamp,
                 "killer": kill_data.get("killer", ""),
                 "killer_id": kill_data.get("killer_id", ""),
                 "victim": kill_data.get("victim", ""),
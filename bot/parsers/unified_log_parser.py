@@ -7,20 +7,136 @@ import asyncio
 import logging
 import os
 import re
-import hashlib
-from datetime import datetime, timezone
+import time
+import urllib.parse
+from collections import Counter, OrderedDict, defaultdict, deque
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, FrozenSet, Tuple, Iterable
 
 import aiofiles
+import aiofiles.os
 import discord
 import asyncssh
 from discord.ext import commands
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
 
+from bot.utils.advanced_rate_limiter import MessagePriority
 from bot.utils.embed_factory import EmbedFactory
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator - falls back to per-line regex scanning
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:  # Optional accelerator - falls back to the stdlib re engine
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=10000)
+def _clean_player_name(raw_name: str) -> str:
+    """URL-decode and tidy a player name from a join request (memoized per raw name)"""
+    try:
+        clean_name = urllib.parse.unquote(raw_name).replace('+', ' ').strip()
+        return clean_name if clean_name else raw_name.strip()
+    except Exception:
+        return raw_name.strip()
+
+# SFTP read pipelining - number of READ requests kept in flight per file
+SFTP_MAX_REQUESTS = int(os.getenv('SFTP_MAX_UNCONFIRMED_READS', '64'))
+SFTP_BLOCK_SIZE = 32768
+
+# Servers parsed at the same time during a parser run
+PARSER_CONCURRENCY = int(os.getenv('PARSER_CONCURRENCY', '8'))
+
+# Characters stripped from resolved player names
+_NAME_CLEAN_RE = re.compile(r'[^\w\s\-_\[\]().]')
+
+# A usable player name: not blank, not a Player_ placeholder, not 'Unknown Player'
+_REAL_NAME_RE = re.compile(r'(?!Player_)(?!Unknown Player\Z).*\S')
+
+def _is_real_name(name: Optional[str]) -> bool:
+    """Check a looked-up player name is worth caching and showing"""
+    return bool(name) and _REAL_NAME_RE.match(name) is not None
+
+# A 24-character hex MongoDB ObjectId (never a Discord guild id)
+_OBJECTID_RE = re.compile(r'[0-9a-fA-F]{24}')
+
+# Embed title -> category. Alternatives are tried in order at the start of the
+# title, so the first category whose keyword appears anywhere wins
+_EMBED_CATEGORY_RE = re.compile(
+    r'(?=.*(?:connect|join|left))(?P<connection>)'
+    r'|(?=.*mission)(?P<mission>)'
+    r'|(?=.*airdrop)(?P<airdrop>)'
+    r'|(?=.*(?:helicrash|helicopter))(?P<helicrash>)'
+    r'|(?=.*trader)(?P<trader>)'
+)
+
+# Substrings the parse loop dispatches on - a line without any of them can't
+# produce an event. Cold starts only rebuild player state, so they need just
+# the player markers
+_PLAYER_LINE_MARKERS = ('Join request', 'UChannel::Close', 'successfully registered')
+# Helicrash lines without a LogSFPS tag use free-form casing, so each casing seen
+# in the logs is its own marker - plain finds stay far cheaper than a caseless regex
+_LINE_MARKERS = _PLAYER_LINE_MARKERS + ('LogSFPS', 'Helicrash', 'HeliCrash', 'helicrash', 'HELICRASH')
+
+def _classify_embed_title(title: Optional[str]) -> str:
+    """Classify an embed by its title: connection, mission, airdrop, helicrash, trader or general"""
+    if not title:
+        return 'general'
+    match = _EMBED_CATEGORY_RE.match(title.lower())
+    return match.lastgroup if match else 'general'
+
+# Player name cache bounds: resolved names are LRU-capped, failed lookups are
+# answered with the temporary name for a short while before retrying
+PLAYER_NAME_CACHE_SIZE = 10000
+UNRESOLVED_NAME_TTL = 60
+
+# Seconds exact pvp_data name lookups are collected before one batched query
+PVP_LOOKUP_BATCH_WINDOW = 0.02
+
+# Seconds server info updates are collected before one bulk write
+SERVER_UPDATE_BATCH_WINDOW = 0.05
+
+# Seconds between batched re-checks of players shown with a temporary name
+TENTATIVE_NAME_SWEEP_INTERVAL = 30
+
+class _LRUCache(OrderedDict):
+    """Dict capped at maxsize entries, evicting the least recently used"""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+# Seconds between background saves of dirty parser state
+STATE_FLUSH_INTERVAL = 30
+
+# Seconds a cached guild config is served before re-reading MongoDB
+GUILD_CACHE_TTL = 60
+
+# Guild documents fetched per cursor batch in each parser run
+GUILD_CURSOR_BATCH_SIZE = 50
+
+# Voice channel rename budget - Discord allows 2 renames per channel every 10 minutes
+VOICE_RENAMES_PER_WINDOW = 2
+VOICE_RENAME_WINDOW = 600
+
 class UnifiedLogParser:
     """
     BULLETPROOF UNIFIED LOG PARSER
@@ -30,80 +146,274 @@ class UnifiedLogParser:
     - Rate limit safe operation
     """
 
+    # Parsed embed field name -> EmbedFactory.build data key
+    _EMBED_FIELD_MAP = {
+        'mission': 'mission_id',
+        'player': 'player_name',
+        'location': 'location',
+        'status': 'state',
+    }
+
+    # Embed category -> label used in the per-server event summary
+    _SUMMARY_KEYS = {
+        'mission': 'missions',
+        'airdrop': 'airdrops',
+        'helicrash': 'helicrashes',
+        'trader': 'traders',
+        'connection': 'connections',
+    }
+
+    # Mission state -> (title, description) for mission embeds
+    _MISSION_STATES = {
+        'READY': ("Mission Available", "New mission objective is ready for deployment"),
+        'IN_PROGRESS': ("Mission In Progress", "Mission objective is currently being completed"),
+        'COMPLETED': ("Mission Completed", "Mission objective has been successfully completed"),
+        'RESPAWN': ("Mission Respawning", "Mission objective is preparing for redeployment"),
+    }
+
+    # World event patterns are written in lowercase for free-form casing;
+    # every other pattern matches the game's fixed-case log literals
+    _CASELESS_PATTERN_PREFIXES = ('airdrop_', 'helicrash_', 'trader_')
+
     def __init__(self, bot):
         self.bot = bot
 
         # Bulletproof state dictionaries with proper isolation
         self.file_states: Dict[str, Dict[str, Any]] = {}
-        self.player_sessions: Dict[str, Dict[str, Any]] = {}
         self.sftp_connections: Dict[str, asyncssh.SSHClientConnection] = {}
+        self.sftp_clients: Dict[str, asyncssh.SFTPClient] = {}
+        # connection_key -> connect / SFTP client open in progress, shared by servers
+        # with the same login so concurrent polls don't open duplicates
+        self._sftp_connecting: Dict[str, asyncio.Future] = {}
+        self._sftp_client_opening: Dict[str, asyncio.Future] = {}
+        # Open connection count, decremented by a watcher task when each one closes
+        self._active_sftp_count = 0
+        self._sftp_watchers: Set[asyncio.Task] = set()
         self.last_log_position: Dict[str, int] = {}
-        self.player_lifecycle: Dict[str, Dict[str, Any]] = {}
+
+        # Player lifecycle (queued -> joined -> disconnected), one dict per attribute
+        # keyed by (guild_id, player_id) instead of a nested dict per player
+        self.lc_name: Dict[Tuple[str, str], str] = {}
+        self.lc_platform: Dict[Tuple[str, str], str] = {}
+        self.lc_state: Dict[Tuple[str, str], str] = {}
+        self.lc_queued_at: Dict[Tuple[str, str], str] = {}
+        self.lc_joined_at: Dict[Tuple[str, str], str] = {}
+        self.lc_disconnected_at: Dict[Tuple[str, str], str] = {}
+
+        # Player sessions, same key; name and platform live in the lifecycle dicts
+        self.session_status: Dict[Tuple[str, str], str] = {}
+        self.session_joined_at: Dict[Tuple[str, str], str] = {}
+        self.session_left_at: Dict[Tuple[str, str], str] = {}
+
+        # Per-guild online/queued counts, kept in step with session_status and lc_state
+        self._online_counts: Counter = Counter()
+        self._queued_counts: Counter = Counter()
+        # (guild_id, first 8 chars of player_id) -> player_ids with a session, for
+        # the similar-ID fallback in resolve_player_name
+        self._session_players_by_prefix: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
         self.server_status: Dict[str, Dict[str, Any]] = {}
         self.log_file_hashes: Dict[str, str] = {}
 
+        # SSH options are validated once and shared by every connection attempt
+        self.ssh_options = asyncssh.SSHClientConnectionOptions(
+            known_hosts=None,
+            server_host_key_algs=['ssh-rsa', 'rsa-sha2-256', 'rsa-sha2-512'],
+            kex_algs=['diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512', 'ecdh-sha2-nistp256', 'ecdh-sha2-nistp384', 'ecdh-sha2-nistp521'],
+            encryption_algs=['aes128-ctr', 'aes192-ctr', 'aes256-ctr', 'aes128-gcm@openssh.com', 'aes256-gcm@openssh.com'],
+            mac_algs=['hmac-sha2-256', 'hmac-sha1'],
+            compression_algs=['zlib@openssh.com', 'none'],
+            keepalive_interval=30
+        )
+
         # Player name resolution cache
-        self.player_name_cache: Dict[str, str] = {}
+        self.player_name_cache: _LRUCache = _LRUCache(PLAYER_NAME_CACHE_SIZE)
+        # cache_key -> (monotonic expiry, temporary name) for lookups that found nothing
+        self._unresolved_names: _LRUCache = _LRUCache(PLAYER_NAME_CACHE_SIZE)
+        # cache_key -> resolution in progress, awaited by concurrent callers
+        self._inflight_resolutions: Dict[Tuple[str, str], asyncio.Future] = {}
+        # guild_id -> player_id -> pending exact pvp_data lookup, flushed as one $in query
+        self._pvp_lookup_queue: Dict[int, Dict[str, asyncio.Future]] = {}
+        # guild_id -> player_ids showing a temporary name, re-checked together by the sweeper
+        self._tentative_ids: Dict[int, Set[str]] = defaultdict(set)
+
+        # (guild_id, server_id, fields) waiting for the next server info bulk write
+        self._pending_server_updates: List[Tuple[int, str, Dict[str, Any]]] = []
 
         # Compile patterns once for efficiency
         self.patterns = self._compile_patterns()
+        self.hs_database = self._compile_hyperscan_database()
         self.mission_mappings = self._get_mission_mappings()
 
+        # Mission levels never change, so resolve the known ones up front
+        self.mission_levels: Dict[str, int] = {
+            mission_id: EmbedFactory.get_mission_level(mission_id) for mission_id in self.mission_mappings
+        }
+        self.high_level_missions: FrozenSet[str] = frozenset(
+            mission_id for mission_id, level in self.mission_levels.items() if level >= 3
+        )
+
+        # State is persisted write-behind: changed server keys are collected and the
+        # flusher $sets just those; a reset forces one full document replace
+        self._dirty_file_states: Set[str] = set()
+        self._state_needs_replace = False
+
+        # guild_id -> (monotonic fetch time, guild config)
+        self._guild_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        # guild_id -> config read in progress, shared by concurrent cache misses
+        self._guild_fetches: Dict[int, asyncio.Future] = {}
+        # guild_id -> voice channel resolved from the cached guild config
+        self._voice_channel_ids: Dict[int, Optional[int]] = {}
+        # guild_id -> primary server name as shown in the voice channel
+        self._server_display_names: Dict[int, str] = {}
+        # guild_id -> server_id -> server entry from the cached guild config
+        self._servers_by_id: Dict[int, Dict[str, Dict[str, Any]]] = {}
+
+        # guild_id -> (active, queued) last shown in the voice channel, and recent rename times
+        self._vc_last_state: Dict[int, Tuple[int, int]] = {}
+        self._vc_rename_times: Dict[int, deque] = {}
+        # guild_id -> trailing update that applies counts deferred by the rename budget
+        self._vc_deferred_updates: Dict[int, asyncio.Task] = {}
+
         # Load state on startup
         asyncio.create_task(self._load_persistent_state())
+        asyncio.create_task(self._state_flusher())
+        asyncio.create_task(self._tentative_name_sweeper())
 
-    def _compile_patterns(self) -> Dict[str, re.Pattern]:
+    @staticmethod
+    def _compile_line_pattern(pattern: str) -> Any:
+        """Compile a line pattern with RE2 when installed, else with re"""
+        if re2 is not None:
+            try:
+                return re2.compile(pattern)
+            except re2.error:
+                pass  # Syntax RE2 doesn't support - keep the backtracking engine
+        return re.compile(pattern)
+
+    def _compile_patterns(self) -> Dict[str, Any]:
         """Compile regex patterns for log parsing"""
         return {
             # Player connection patterns - explicit matching based on provided examples
-            'player_queue_join': re.compile(
-                r'LogNet: Join request: /Game/Maps/world_\d+/World_\d+\?.*?eosid=\|([a-f0-9]+).*?Name=([^&\?\s]+).*?(?:platformid=([^&\?\s]+))?',
-                re.IGNORECASE
+            # The join URL has no spaces, so each gap is bounded to one \S run
+            'player_queue_join': self._compile_line_pattern(
+                r'LogNet: Join request: /Game/Maps/world_\d+/World_\d+\?\S*?eosid=\|([a-fA-F0-9]+)\S*?Name=([^&\?\s]+)(?:\S*?platformid=([^&\?\s]+))?'
             ),
-            'player_registered': re.compile(
-                r'LogOnline: Warning: Player \|([a-f0-9]+) successfully registered!',
-                re.IGNORECASE
+            'player_registered': self._compile_line_pattern(
+                r'LogOnline: Warning: Player \|([a-fA-F0-9]+) successfully registered!'
             ),
-            'player_disconnect': re.compile(
-                r'LogNet: UChannel::Close: Sending CloseBunch.*?UniqueId: EOS:\|([a-f0-9]+)',
-                re.IGNORECASE
+            'player_disconnect': self._compile_line_pattern(
+                r'LogNet: UChannel::Close: Sending CloseBunch.*?UniqueId: EOS:\|([a-fA-F0-9]+)'
             ),
 
             # Server configuration patterns
-            'max_player_count': re.compile(r'MaxPlayerCount=(\d+)', re.IGNORECASE),
-            'server_name_pattern': re.compile(r'ServerName=([^,\s]+)', re.IGNORECASE),
+            'max_player_count': self._compile_line_pattern(r'MaxPlayerCount=(\d+)'),
 
             # Mission patterns
-            'mission_respawn': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) will respawn in (\d+)', re.IGNORECASE),
-            'mission_state_change': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to ([A-Z_]+)', re.IGNORECASE),
-            'mission_ready': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to READY', re.IGNORECASE),
-            'mission_initial': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to INITIAL', re.IGNORECASE),
-            'mission_in_progress': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to IN_PROGRESS', re.IGNORECASE),
-            'mission_completed': re.compile(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to COMPLETED', re.IGNORECASE),
+            'mission_state_change': self._compile_line_pattern(r'LogSFPS: Mission (GA_[A-Za-z0-9_]+) switched to ([A-Z_]+)'),
 
             # Vehicle patterns
-            'vehicle_spawn': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Add\] Add vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)', re.IGNORECASE),
-            'vehicle_delete': re.compile(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Del\] Del vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)', re.IGNORECASE),
+            'vehicle_spawn': self._compile_line_pattern(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Add\] Add vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)'),
+            'vehicle_delete': self._compile_line_pattern(r'LogSFPS: \[ASFPSGameMode::NewVehicle_Del\] Del vehicle (BP_SFPSVehicle_[A-Za-z0-9_]+)'),
+
+            # World event patterns below have free-form casing and are matched
+            # against the lowercased line
 
             # Airdrop patterns
-            'airdrop_event': re.compile(r'Event_AirDrop.*spawned.*location.*X=([\d\.-]+).*Y=([\d\.-]+)', re.IGNORECASE),
-            'airdrop_spawn': re.compile(r'LogSFPS:.*airdrop.*spawn', re.IGNORECASE),
-            'airdrop_flying': re.compile(r'LogSFPS:.*airdrop.*flying', re.IGNORECASE),
+            'airdrop_flying': self._compile_line_pattern(r'logsfps:.*airdrop.*flying'),
 
             # Helicrash patterns
-            'helicrash_event': re.compile(r'Helicrash.*spawned.*location.*X=([\d\.-]+).*Y=([\d\.-]+)', re.IGNORECASE),
-            'helicrash_spawn': re.compile(r'LogSFPS:.*helicrash.*spawn', re.IGNORECASE),
-            'helicrash_crash': re.compile(r'LogSFPS:.*helicopter.*crash', re.IGNORECASE),
+            'helicrash_event': self._compile_line_pattern(r'helicrash.*spawned.*location.*x=([\d\.-]+).*y=([\d\.-]+)'),
+            'helicrash_crash': self._compile_line_pattern(r'logsfps:.*helicopter.*crash'),
 
             # Trader patterns
-            'trader_spawn': re.compile(r'Trader.*spawned.*location.*X=([\d\.-]+).*Y=([\d\.-]+)', re.IGNORECASE),
-            'trader_event': re.compile(r'LogSFPS:.*trader.*spawn', re.IGNORECASE),
-            'trader_arrival': re.compile(r'LogSFPS:.*trader.*arrived', re.IGNORECASE),
-
-            # Timestamp
-            'timestamp': re.compile(r'\[(\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}:\d{3})\]')
+            'trader_arrival': self._compile_line_pattern(r'logsfps:.*trader.*arrived'),
         }
 
+    def _compile_hyperscan_database(self) -> Optional[Any]:
+        """Compile all line patterns into one Hyperscan database (if available)"""
+        if hyperscan is None:
+            return None
+
+        try:
+            # Caseless only where needed so the other literals stay exact and selective
+            pattern_names = list(self.patterns)
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[self.patterns[name].pattern.encode('utf-8') for name in pattern_names],
+                ids=list(range(len(pattern_names))),
+                elements=len(pattern_names),
+                flags=[
+                    hyperscan.HS_FLAG_CASELESS if name.startswith(self._CASELESS_PATTERN_PREFIXES) else 0
+                    for name in pattern_names
+                ]
+            )
+            logger.info(f"✅ Hyperscan database compiled with {len(pattern_names)} patterns")
+            return database
+        except Exception as e:
+            logger.warning(f"Hyperscan unavailable, using regex scanning: {e}")
+            return None
+
+    @staticmethod
+    def _line_timestamp(line: str) -> Optional[str]:
+        """Extract the fixed-width [YYYY.MM.DD-HH.MM.SS:mmm] prefix used for event ordering"""
+        if line[:1] == '[' and line[24:25] == ']':
+            return line[1:24]
+        return None
+
+    @staticmethod
+    def _line_offset(content: str, line_number: int) -> int:
+        """Character offset at which the given (0-based) line starts"""
+        offset = 0
+        for _ in range(line_number):
+            offset = content.find('\n', offset) + 1
+        return offset
+
+    @staticmethod
+    def _marker_lines(content: str, start: int = 0, markers: Tuple[str, ...] = _LINE_MARKERS) -> List[str]:
+        """Lines containing a dispatch marker, found with whole-buffer str.find scans"""
+        line_spans: Dict[int, int] = {}
+        for marker in markers:
+            index = content.find(marker, start)
+            while index != -1:
+                line_start = content.rfind('\n', start, index) + 1 or start
+                line_end = content.find('\n', index)
+                if line_end == -1:
+                    line_end = len(content)
+                line_spans[line_start] = line_end
+                # Further hits on the same line add nothing
+                index = content.find(marker, line_end)
+
+        return [
+            content[line_start:line_spans[line_start]].rstrip('\r')
+            for line_start in sorted(line_spans)
+        ]
+
+    def _filter_candidate_lines(self, content: str, start: int = 0) -> Iterable[str]:
+        """Yield only lines matched by at least one pattern, in original order"""
+        if self.hs_database is None:
+            return self._marker_lines(content, start)
+
+        buffer = content[start:].encode('utf-8')
+        line_starts: Set[int] = set()
+
+        def on_match(pattern_id, match_start, match_end, flags, context):
+            # Patterns never span a newline, so the match end locates its line
+            line_starts.add(buffer.rfind(b'\n', 0, match_end) + 1)
+            return None
+
+        try:
+            self.hs_database.scan(buffer, match_event_handler=on_match)
+        except Exception as e:
+            logger.warning(f"Hyperscan scan failed, using regex scanning: {e}")
+            return self._marker_lines(content, start)
+
+        candidates = []
+        for line_start in sorted(line_starts):
+            line_end = buffer.find(b'\n', line_start)
+            line = buffer[line_start:line_end if line_end != -1 else len(buffer)]
+            candidates.append(line.decode('utf-8', errors='replace').rstrip('\r'))
+
+        return candidates
+
     def _get_mission_mappings(self) -> Dict[str, str]:
         """Mission ID to readable name mappings"""
         return {
@@ -147,8 +457,11 @@ class UnifiedLogParser:
         return EmbedFactory.normalize_mission_name(mission_id)
 
     def get_mission_level(self, mission_id: str) -> int:
-        """Determine mission difficulty level using EmbedFactory"""
-        return EmbedFactory.get_mission_level(mission_id)
+        """Determine mission difficulty level using EmbedFactory (memoized per mission)"""
+        level = self.mission_levels.get(mission_id)
+        if level is None:
+            level = self.mission_levels[mission_id] = EmbedFactory.get_mission_level(mission_id)
+        return level
 
     async def get_sftp_connection(self, server_config: Dict[str, Any]) -> Optional[asyncssh.SSHClientConnection]:
         """Get or create bulletproof SFTP connection"""
@@ -178,7 +491,27 @@ class UnifiedLogParser:
                         del self.sftp_connections[connection_key]
                 except:
                     del self.sftp_connections[connection_key]
+                # Any SFTP client opened on the dead connection is unusable too
+                self.sftp_clients.pop(connection_key, None)
+
+            # Servers sharing a login are parsed concurrently - only one of them connects
+            connecting = self._sftp_connecting.get(connection_key)
+            if connecting is None:
+                connecting = asyncio.ensure_future(
+                    self._open_sftp_connection(connection_key, host, port, username, password)
+                )
+                self._sftp_connecting[connection_key] = connecting
+                connecting.add_done_callback(lambda _: self._sftp_connecting.pop(connection_key, None))
+            return await asyncio.shield(connecting)
 
+        except Exception as e:
+            logger.error(f"SFTP connection error: {e}")
+            return None
+
+    async def _open_sftp_connection(self, connection_key: str, host: str, port: int,
+                                    username: str, password: str) -> Optional[asyncssh.SSHClientConnection]:
+        """Connect with retries and pool the connection under connection_key"""
+        try:
             # Create new connection with bulletproof settings
             for attempt in range(3):
                 try:
@@ -188,15 +521,12 @@ class UnifiedLogParser:
                             username=username,
                             password=password,
                             port=port,
-                            known_hosts=None,
-                            server_host_key_algs=['ssh-rsa', 'rsa-sha2-256', 'rsa-sha2-512'],
-                            kex_algs=['diffie-hellman-group14-sha256', 'diffie-hellman-group16-sha512', 'ecdh-sha2-nistp256', 'ecdh-sha2-nistp384', 'ecdh-sha2-nistp521'],
-                            encryption_algs=['aes128-ctr', 'aes192-ctr', 'aes256-ctr', 'aes128-gcm@openssh.com', 'aes256-gcm@openssh.com'],
-                            mac_algs=['hmac-sha2-256', 'hmac-sha1']
+                            options=self.ssh_options
                         ),
                         timeout=30
                     )
                     self.sftp_connections[connection_key] = conn
+                    self._track_sftp_connection(conn)
                     logger.info(f"✅ SFTP connected to {host}:{port}")
                     return conn
 
@@ -212,45 +542,141 @@ class UnifiedLogParser:
             logger.error(f"SFTP connection error: {e}")
             return None
 
-    async def get_log_content(self, server_config: Dict[str, Any]) -> Optional[str]:
-        """Get log content with SFTP priority and local fallback"""
+    def _track_sftp_connection(self, conn: asyncssh.SSHClientConnection):
+        """Count a connection as open until asyncssh reports it closed"""
+        self._active_sftp_count += 1
+
+        async def watch():
+            try:
+                await conn.wait_closed()
+            finally:
+                self._active_sftp_count -= 1
+
+        watcher = asyncio.create_task(watch())
+        self._sftp_watchers.add(watcher)
+        watcher.add_done_callback(self._sftp_watchers.discard)
+
+    async def get_sftp_client(self, server_config: Dict[str, Any]) -> Optional[asyncssh.SFTPClient]:
+        """Get or open a persistent SFTP client on the pooled connection"""
+        conn = await self.get_sftp_connection(server_config)
+        if not conn:
+            return None
+
+        connection_key = f"{server_config.get('host')}:{server_config.get('port', 22)}:{server_config.get('username')}"
+        sftp = self.sftp_clients.get(connection_key)
+        if sftp is None:
+            opening = self._sftp_client_opening.get(connection_key)
+            if opening is None:
+                opening = asyncio.ensure_future(self._open_sftp_client(connection_key, conn))
+                self._sftp_client_opening[connection_key] = opening
+                opening.add_done_callback(lambda _: self._sftp_client_opening.pop(connection_key, None))
+            sftp = await asyncio.shield(opening)
+        return sftp
+
+    async def _open_sftp_client(self, connection_key: str, conn: asyncssh.SSHClientConnection) -> asyncssh.SFTPClient:
+        """Start the SFTP subsystem on a pooled connection and cache the client"""
+        sftp = await conn.start_sftp_client()
+        self.sftp_clients[connection_key] = sftp
+        return sftp
+
+    def _evict_sftp_client(self, server_config: Dict[str, Any]):
+        """Drop a cached SFTP client after an error so the next poll reopens it"""
+        connection_key = f"{server_config.get('host')}:{server_config.get('port', 22)}:{server_config.get('username')}"
+        sftp = self.sftp_clients.pop(connection_key, None)
+        if sftp is not None:
+            try:
+                sftp.exit()
+            except Exception:
+                pass
+
+    def _tail_start(self, server_key: Optional[str], file_size: int) -> Tuple[bool, int]:
+        """Return (is_delta, offset) for reading the log from where the last poll stopped"""
+        is_delta = server_key is not None and server_key in self.last_log_position
+        prior_offset = self.last_log_position.get(server_key, 0) if is_delta else 0
+        if file_size < prior_offset:
+            # Log rotated - the whole new file is unseen data
+            logger.info(f"🔄 Log rotated for {server_key}, reading from start")
+            prior_offset = 0
+        return is_delta, prior_offset
+
+    def _consume_complete_lines(self, server_key: Optional[str], prior_offset: int, chunk: bytes) -> str:
+        """Decode the complete lines of a read and advance the stored offset past them"""
+        # Only consume complete lines so a line being written is not split
+        chunk = chunk[:chunk.rfind(b'\n') + 1]
+        if server_key is not None:
+            self.last_log_position[server_key] = prior_offset + len(chunk)
+        return chunk.decode('utf-8', errors='replace')
+
+    async def get_log_content(self, server_config: Dict[str, Any], server_key: Optional[str] = None) -> Tuple[Optional[str], bool]:
+        """
+        Get log content with SFTP priority and local fallback
+
+        Returns (content, is_delta). When a byte offset is known for server_key the
+        SFTP read resumes from it and only the new complete lines are returned.
+        """
         try:
             server_id = str(server_config.get('_id', 'unknown'))
             host = server_config.get('host', 'unknown')
 
-            # Try SFTP first
-            conn = await self.get_sftp_connection(server_config)
-            if conn:
+            # Try SFTP first - the client channel is reused across polls
+            try:
+                sftp = await self.get_sftp_client(server_config)
+            except Exception as e:
+                logger.error(f"SFTP client failed: {e}")
+                sftp = None
+
+            if sftp:
                 try:
                     remote_path = f"./{host}_{server_id}/Logs/Deadside.log"
-                    logger.info(f"📡 Reading SFTP: {remote_path}")
-
-                    async with conn.start_sftp_client() as sftp:
-                        try:
-                            await sftp.stat(remote_path)
-                            async with sftp.open(remote_path, 'r') as f:
-                                content = await f.read()
-                                logger.info(f"✅ SFTP read {len(content)} bytes")
-                                return content
-                        except FileNotFoundError:
-                            logger.warning(f"Remote file not found: {remote_path}")
+                    logger.debug("📡 Reading SFTP: %s", remote_path)
+
+                    try:
+                        attrs = await sftp.stat(remote_path)
+                        file_size = attrs.size or 0
+                        is_delta, prior_offset = self._tail_start(server_key, file_size)
+                        if is_delta and prior_offset == file_size:
+                            # Unchanged size - nothing new to fetch
+                            return '', True
+
+                        async with sftp.open(remote_path, 'rb', block_size=SFTP_BLOCK_SIZE, max_requests=SFTP_MAX_REQUESTS) as f:
+                            await f.seek(prior_offset)
+                            chunk = await f.read(file_size - prior_offset)
+
+                        content = self._consume_complete_lines(server_key, prior_offset, chunk)
+                        logger.debug("✅ SFTP read %d bytes from offset %d", len(content), prior_offset)
+                        return content, is_delta
+                    except FileNotFoundError:
+                        logger.warning(f"Remote file not found: {remote_path}")
 
                 except Exception as e:
                     logger.error(f"SFTP read failed: {e}")
+                    self._evict_sftp_client(server_config)
 
             # Fallback to local file
             local_path = f'./{host}_{server_id}/Logs/Deadside.log'
             logger.info(f"📁 Fallback to local: {local_path}")
 
-            if os.path.exists(local_path):
+            try:
+                stat_result = await aiofiles.os.stat(local_path)
+            except FileNotFoundError:
+                stat_result = None
+
+            if stat_result is not None:
                 try:
-                    with open(local_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        logger.info(f"✅ Local read {len(content)} bytes")
-                        return content
+                    is_delta, prior_offset = self._tail_start(server_key, stat_result.st_size)
+                    if is_delta and prior_offset == stat_result.st_size:
+                        return '', True
+
+                    async with aiofiles.open(local_path, 'rb') as f:
+                        await f.seek(prior_offset)
+                        chunk = await f.read(stat_result.st_size - prior_offset)
+
+                    content = self._consume_complete_lines(server_key, prior_offset, chunk)
+                    logger.debug("✅ Local read %d bytes from offset %d", len(content), prior_offset)
+                    return content, is_delta
                 except Exception as e:
                     logger.error(f"Local read failed: {e}")
-            else:
+            elif os.environ.get('DEADSIDE_DEV_FIXTURES') == '1':
                 # Create test file for development
                 logger.info(f"Creating test log file at {local_path}")
                 test_dir = os.path.dirname(local_path)
@@ -263,161 +689,241 @@ class UnifiedLogParser:
 [2025.05.30-12.25.00:000] LogSFPS: Mission GA_Airport_mis_01_SFPSACMission switched to COMPLETED
 [2025.05.30-12.25.15:000] UChannel::Close: Sending CloseBunch UniqueId: EOS:|abc123def456"""
 
-                with open(local_path, 'w', encoding='utf-8') as f:
-                    f.write(test_content)
-                return test_content
+                async with aiofiles.open(local_path, 'w', encoding='utf-8') as f:
+                    await f.write(test_content)
+                return test_content, False
 
-            return None
+            return None, False
 
         except Exception as e:
             logger.error(f"Error getting log content: {e}")
-            return None
+            return None, False
 
-    async def parse_log_content(self, content: str, guild_id: str, server_id: str, cold_start: bool = False, server_name: str = "Unknown Server") -> List[discord.Embed]:
-        """Parse log content and return embeds"""
+    async def parse_log_content(self, content: str, guild_id: str, server_id: str, cold_start: bool = False, server_name: str = "Unknown Server", is_delta: bool = False) -> List[discord.Embed]:
+        """Parse log content and return embeds (content is only the new lines when is_delta)"""
         embeds = []
         if not content:
             return embeds
 
-        lines = content.splitlines()
+        guild_id = str(guild_id)
         server_key = f"{guild_id}_{server_id}"
 
+        # One wall-clock reading per parse - state timestamps don't need finer resolution
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        # Count lines without materializing them - content can be the whole log
+        line_count = content.count('\n') + (0 if content.endswith('\n') else 1)
+
         # Get current state
         file_state = self.file_states.get(server_key, {})
         last_processed = file_state.get('line_count', 0)
 
         # Determine what to process
+        total_lines = line_count
+        start_offset = 0
         if cold_start or last_processed == 0:
             # Cold start: process all but don't generate embeds
-            lines_to_process = lines
-            logger.info(f"🧊 Cold start: processing {len(lines)} lines")
+            logger.info(f"🧊 Cold start: processing {line_count} lines")
+        elif is_delta:
+            # Incremental tail: every line read is new
+            total_lines = last_processed + line_count
+            logger.info(f"🔥 Hot start: processing {line_count} new lines")
         else:
-            # Hot start: process only new lines
-            if last_processed < len(lines):
-                lines_to_process = lines[last_processed:]
-                logger.info(f"🔥 Hot start: processing {len(lines_to_process)} new lines")
+            # Full read fallback: skip lines already processed
+            if last_processed < line_count:
+                start_offset = self._line_offset(content, last_processed)
+                logger.info(f"🔥 Hot start: processing {line_count - last_processed} new lines")
             else:
                 logger.info("📊 No new lines to process")
                 return embeds
 
+        # Drop lines no pattern can match before any per-line regex work. Cold
+        # starts emit no embeds, so only player lifecycle lines are kept
+        if cold_start:
+            lines_to_process = self._marker_lines(content, start_offset, _PLAYER_LINE_MARKERS)
+        else:
+            lines_to_process = self._filter_candidate_lines(content, start_offset)
+
         # Update state immediately
         self.file_states[server_key] = {
-            'line_count': len(lines),
-            'last_updated': datetime.now(timezone.utc).isoformat(),
+            'line_count': total_lines,
+            'byte_offset': self.last_log_position.get(server_key),
+            'last_updated': now_iso,
             'cold_start_complete': True
         }
-        await self._save_persistent_state()
+        self._dirty_file_states.add(server_key)
 
         # Track voice channel updates needed and player events for sequential processing
         voice_channel_needs_update = False
         player_events = []
+        connection_embed_data = []
+        non_player_embeds = []
         extracted_max_players = None
         extracted_server_name = None
 
         # Extract server configuration during cold start
         if cold_start:
-            for line in lines:
-                # Extract MaxPlayerCount
-                max_player_match = self.patterns['max_player_count'].search(line)
-                if max_player_match:
-                    try:
-                        extracted_max_players = int(max_player_match.group(1))
-                        logger.info(f"📊 Extracted MaxPlayerCount: {extracted_max_players} for server {server_id}")
-                    except ValueError:
-                        pass
+            # One scan of the whole log instead of a regex search per line - the
+            # last MaxPlayerCount wins, as the setting may change between restarts
+            max_player_counts = self.patterns['max_player_count'].findall(content)
+            if max_player_counts:
+                extracted_max_players = int(max_player_counts[-1])
+                logger.info(f"📊 Extracted MaxPlayerCount: {extracted_max_players} for server {server_id}")
 
-                # Use configured server name from guild settings (no regex extraction needed)
-                # Server name is already available from server_config['name']
+            # Use configured server name from guild settings (no regex extraction needed)
+            # Server name is already available from server_config['name']
 
             # Store extracted server info in database during cold start
             if extracted_max_players or extracted_server_name:
                 await self._update_server_info(guild_id, server_id, extracted_max_players)
 
-        # First pass: collect all player events with timestamps for sequential processing
+        # Single pass: collect player events for sequential processing and
+        # build non-player embeds inline
         for line in lines_to_process:
             try:
-                # Extract timestamp from line for ordering
-                timestamp_match = self.patterns['timestamp'].search(line)
-                line_timestamp = timestamp_match.group(1) if timestamp_match else None
-
-                # Queue event - Extract EosID, Player Name, and Platform
-                queue_match = self.patterns['player_queue_join'].search(line)
-                if queue_match:
-                    groups = queue_match.groups()
-                    player_id = groups[0]
-                    player_name = groups[1] if len(groups) > 1 else "Unknown"
-                    platform = groups[2] if len(groups) > 2 and groups[2] else "Unknown"
-
-                    # Extract platform from platformid format (e.g., "PS5:3566759921101398874" -> "PS5")
-                    if platform and ":" in platform:
-                        platform = platform.split(":")[0]
-
-                    # Clean and decode the player name
-                    import urllib.parse
-                    try:
-                        decoded_name = urllib.parse.unquote(player_name)
-                        clean_name = decoded_name.replace('+', ' ').strip()
-                        final_name = clean_name if clean_name else player_name.strip()
-                    except Exception:
-                        final_name = player_name.strip()
-
-                    # Store in lifecycle with queue state
-                    lifecycle_key = f"{guild_id}_{player_id}"
-                    self.player_lifecycle[lifecycle_key] = {
-                        'name': final_name,
-                        'platform': platform,
-                        'state': 'queued',
-                        'queued_at': datetime.now(timezone.utc).isoformat()
-                    }
-                    logger.debug(f"👤 Player queued: {player_id} -> '{final_name}' on {platform}")
-
-                # Join event - Player successfully registered
-                register_match = self.patterns['player_registered'].search(line)
-                if register_match:
-                    player_id = register_match.group(1)
-                    lifecycle_key = f"{guild_id}_{player_id}"
-
-                    # Check if we have queue data for this player
-                    if lifecycle_key in self.player_lifecycle:
-                        # Update state to joined
-                        self.player_lifecycle[lifecycle_key]['state'] = 'joined'
-                        self.player_lifecycle[lifecycle_key]['joined_at'] = datetime.now(timezone.utc).isoformat()
-                    else:
-                        # Player joined without queue data - create minimal record
-                        self.player_lifecycle[lifecycle_key] = {
-                            'name': f"Player{player_id[:8].upper()}",
-                            'platform': 'Unknown',
-                            'state': 'joined',
-                            'joined_at': datetime.now(timezone.utc).isoformat()
-                        }
-
-                    player_events.append({
-                        'type': 'join',
-                        'player_id': player_id,
-                        'timestamp': line_timestamp,
-                        'line': line
-                    })
-
-                # Disconnect event - Player disconnected
-                disconnect_match = self.patterns['player_disconnect'].search(line)
-                if disconnect_match:
-                    player_id = disconnect_match.group(1)
-                    lifecycle_key = f"{guild_id}_{player_id}"
+                # Cheap literal checks route each line to the only regexes that can match it,
+                # grouped by log category so unmatched lines cost one check per category
+                world_event = False
+                if 'LogNet: ' in line:
+                    if 'Join request' in line:
+                        # Queue event - Extract EosID, Player Name, and Platform
+                        queue_match = self.patterns['player_queue_join'].search(line)
+                        if queue_match:
+                            groups = queue_match.groups()
+                            player_id = groups[0]
+                            player_name = groups[1] if len(groups) > 1 else "Unknown"
+                            platform = groups[2] if len(groups) > 2 and groups[2] else "Unknown"
+
+                            # Extract platform from platformid format (e.g., "PS5:3566759921101398874" -> "PS5")
+                            if platform and ":" in platform:
+                                platform = platform.split(":")[0]
+
+                            # Clean and decode the player name
+                            final_name = _clean_player_name(player_name)
+
+                            # Store in lifecycle with queue state
+                            player_key = (guild_id, player_id)
+                            self.lc_name[player_key] = final_name
+                            self.lc_platform[player_key] = platform
+                            self._set_lifecycle_state(player_key, 'queued')
+                            self.lc_queued_at[player_key] = now_iso
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("👤 Player queued: %s -> '%s' on %s", player_id, final_name, platform)
+
+                    elif 'UChannel::Close' in line:
+                        # Disconnect event - Player disconnected
+                        disconnect_match = self.patterns['player_disconnect'].search(line)
+                        if disconnect_match:
+                            player_id = disconnect_match.group(1)
+                            player_key = (guild_id, player_id)
+
+                            # Only emit disconnect if player was previously joined
+                            if self.lc_state.get(player_key) == 'joined':
+                                self._set_lifecycle_state(player_key, 'disconnected')
+                                self.lc_disconnected_at[player_key] = now_iso
+
+                                player_events.append({
+                                    'type': 'disconnect',
+                                    'player_id': player_id,
+                                    'timestamp': self._line_timestamp(line),
+                                    'line': line
+                                })
+
+                elif 'LogSFPS' in line:
+                    if 'LogSFPS: Mission' in line:
+                        # Mission events - ONLY READY missions of level 3+
+                        mission_match = self.patterns['mission_state_change'].search(line)
+                        if mission_match:
+                            mission_id, state = mission_match.groups()
+
+                            if not cold_start:
+                                # Only process READY missions of level 3 or higher
+                                if state == 'READY' and (mission_id in self.high_level_missions or self.get_mission_level(mission_id) >= 3):
+                                    embed = await self.create_mission_embed(mission_id, state)
+                                    if embed:
+                                        non_player_embeds.append(embed)
+
+                    elif 'NewVehicle_Add' in line:
+                        # Vehicle events
+                        vehicle_spawn_match = self.patterns['vehicle_spawn'].search(line)
+                        if vehicle_spawn_match:
+                            vehicle_type = vehicle_spawn_match.group(1)
+                            if not cold_start:
+                                embed = await self.create_vehicle_embed('spawn', vehicle_type)
+                                if embed:
+                                    non_player_embeds.append(embed)
+
+                    elif 'NewVehicle_Del' in line:
+                        vehicle_delete_match = self.patterns['vehicle_delete'].search(line)
+                        if vehicle_delete_match:
+                            vehicle_type = vehicle_delete_match.group(1)
+                            if not cold_start:
+                                embed = await self.create_vehicle_embed('delete', vehicle_type)
+                                if embed:
+                                    non_player_embeds.append(embed)
 
-                    # Only emit disconnect if player was previously joined
-                    if lifecycle_key in self.player_lifecycle and self.player_lifecycle[lifecycle_key].get('state') == 'joined':
-                        self.player_lifecycle[lifecycle_key]['state'] = 'disconnected'
-                        self.player_lifecycle[lifecycle_key]['disconnected_at'] = datetime.now(timezone.utc).isoformat()
+                    else:
+                        world_event = True
+
+                elif 'successfully registered' in line:
+                    # Join event - Player successfully registered
+                    register_match = self.patterns['player_registered'].search(line)
+                    if register_match:
+                        player_id = register_match.group(1)
+                        player_key = (guild_id, player_id)
+
+                        # Check if we have queue data for this player
+                        if player_key not in self.lc_state:
+                            # Player joined without queue data - create minimal record
+                            self.lc_name[player_key] = f"Player{player_id[:8].upper()}"
+                            self.lc_platform[player_key] = 'Unknown'
+                        self._set_lifecycle_state(player_key, 'joined')
+                        self.lc_joined_at[player_key] = now_iso
 
                         player_events.append({
-                            'type': 'disconnect',
+                            'type': 'join',
                             'player_id': player_id,
-                            'timestamp': line_timestamp,
+                            'timestamp': self._line_timestamp(line),
                             'line': line
                         })
 
+                elif 'helicrash' in line.lower():
+                    # Untagged helicrash lines come in any casing
+                    world_event = True
+
+                if world_event:
+                    # World events use free-form casing, so lowercase only these lines
+                    line_lower = line.lower()
+
+                    if 'airdrop' in line_lower:
+                        # Airdrop events - ONLY flying state
+                        airdrop_flying_match = self.patterns['airdrop_flying'].search(line_lower)
+                        if airdrop_flying_match:
+                            if not cold_start:
+                                embed = await self.create_airdrop_embed()
+                                if embed:
+                                    non_player_embeds.append(embed)
+
+                    elif 'heli' in line_lower:
+                        # Helicrash events - ONLY crash/ready state
+                        helicrash_match = self.patterns['helicrash_event'].search(line_lower) or self.patterns['helicrash_crash'].search(line_lower)
+                        if helicrash_match:
+                            if not cold_start:
+                                embed = await self.create_helicrash_embed()
+                                if embed:
+                                    non_player_embeds.append(embed)
+
+                    elif 'trader' in line_lower:
+                        # Trader events - ONLY arrival/ready state
+                        trader_arrival_match = self.patterns['trader_arrival'].search(line_lower)
+                        if trader_arrival_match:
+                            if not cold_start:
+                                embed = await self.create_trader_embed()
+                                if embed:
+                                    non_player_embeds.append(embed)
+
             except Exception as e:
-                logger.error(f"Error collecting player events from line: {e}")
+                logger.error(f"Error processing line: {e}")
                 continue
 
         # Process player events in chronological order
@@ -427,23 +933,16 @@ class UnifiedLogParser:
             try:
                 if event['type'] == 'join':
                     player_id = event['player_id']
-                    lifecycle_key = f"{guild_id}_{player_id}"
-                    session_key = f"{guild_id}_{player_id}"
+                    player_key = (guild_id, player_id)
 
                     # Get player data from lifecycle
-                    lifecycle_data = self.player_lifecycle.get(lifecycle_key, {})
-                    player_name = lifecycle_data.get('name', f"Player{player_id[:8].upper()}")
-                    platform = lifecycle_data.get('platform', 'Unknown')
+                    player_name = self.lc_name.get(player_key, f"Player{player_id[:8].upper()}")
+                    platform = self.lc_platform.get(player_key, 'Unknown')
 
                     # Track active session
-                    self.player_sessions[session_key] = {
-                        'player_id': player_id,
-                        'player_name': player_name,
-                        'platform': platform,
-                        'guild_id': guild_id,
-                        'joined_at': datetime.now(timezone.utc).isoformat(),
-                        'status': 'online'
-                    }
+                    self._set_session_status(player_key, 'online')
+                    self.session_joined_at[player_key] = now_iso
+                    self.session_left_at.pop(player_key, None)
 
                     # Mark voice channel for update
                     voice_channel_needs_update = True
@@ -458,25 +957,20 @@ class UnifiedLogParser:
                             'server_name': server_name
                         }
 
-                        final_embed, file_attachment = await EmbedFactory.build('connection', embed_data)
-                        embeds.append(final_embed)
+                        connection_embed_data.append(embed_data)
 
                 elif event['type'] == 'disconnect':
                     player_id = event['player_id']
-                    lifecycle_key = f"{guild_id}_{player_id}"
-                    session_key = f"{guild_id}_{player_id}"
-
-                    # Get player data from lifecycle or session
-                    lifecycle_data = self.player_lifecycle.get(lifecycle_key, {})
-                    session_data = self.player_sessions.get(session_key, {})
+                    player_key = (guild_id, player_id)
 
-                    player_name = lifecycle_data.get('name') or session_data.get('player_name', f"Player{player_id[:8].upper()}")
-                    platform = lifecycle_data.get('platform') or session_data.get('platform', 'Unknown')
+                    # Get player data from lifecycle
+                    player_name = self.lc_name.get(player_key) or f"Player{player_id[:8].upper()}"
+                    platform = self.lc_platform.get(player_key) or 'Unknown'
 
                     # Update session status
-                    if session_key in self.player_sessions:
-                        self.player_sessions[session_key]['status'] = 'offline'
-                        self.player_sessions[session_key]['left_at'] = datetime.now(timezone.utc).isoformat()
+                    if player_key in self.session_status:
+                        self._set_session_status(player_key, 'offline')
+                        self.session_left_at[player_key] = now_iso
 
                     # Mark voice channel for update
                     voice_channel_needs_update = True
@@ -491,79 +985,31 @@ class UnifiedLogParser:
                             'server_name': server_name
                         }
 
-                        final_embed, file_attachment = await EmbedFactory.build('connection', embed_data)
-                        embeds.append(final_embed)
+                        connection_embed_data.append(embed_data)
 
             except Exception as e:
                 logger.error(f"Error processing player event: {e}")
                 continue
 
-        # Second pass: process non-player events
-        for line in lines_to_process:
-            try:
-
-                # Mission events - ONLY READY missions of level 3+
-                mission_match = self.patterns['mission_state_change'].search(line)
-                if mission_match:
-                    mission_id, state = mission_match.groups()
-
-                    if not cold_start:
-                        # Only process READY missions of level 3 or higher
-                        if state == 'READY':
-                            mission_level = self.get_mission_level(mission_id)
-                            if mission_level >= 3:
-                                embed = await self.create_mission_embed(mission_id, state)
-                                if embed:
-                                    embeds.append(embed)
-
-                # Airdrop events - ONLY flying state
-                airdrop_flying_match = self.patterns['airdrop_flying'].search(line)
-                if airdrop_flying_match:
-                    if not cold_start:
-                        embed = await self.create_airdrop_embed()
-                        if embed:
-                            embeds.append(embed)
-
-                # Helicrash events - ONLY crash/ready state
-                helicrash_match = self.patterns['helicrash_event'].search(line) or self.patterns['helicrash_crash'].search(line)
-                if helicrash_match:
-                    if not cold_start:
-                        embed = await self.create_helicrash_embed()
-                        if embed:
-                            embeds.append(embed)
-
-                # Trader events - ONLY arrival/ready state  
-                trader_arrival_match = self.patterns['trader_arrival'].search(line)
-                if trader_arrival_match:
-                    if not cold_start:
-                        embed = await self.create_trader_embed()
-                        if embed:
-                            embeds.append(embed)
-
-                # Vehicle events
-                vehicle_spawn_match = self.patterns['vehicle_spawn'].search(line)
-                if vehicle_spawn_match:
-                    vehicle_type = vehicle_spawn_match.group(1)
-                    if not cold_start:
-                        embed = await self.create_vehicle_embed('spawn', vehicle_type)
-                        if embed:
-                            embeds.append(embed)
-
-                vehicle_delete_match = self.patterns['vehicle_delete'].search(line)
-                if vehicle_delete_match:
-                    vehicle_type = vehicle_delete_match.group(1)
-                    if not cold_start:
-                        embed = await self.create_vehicle_embed('delete', vehicle_type)
-                        if embed:
-                            embeds.append(embed)
+        # Build connection embeds together once all events are ordered
+        if connection_embed_data:
+            results = await asyncio.gather(
+                *(EmbedFactory.build('connection', embed_data) for embed_data in connection_embed_data),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error building connection embed: {result}")
+                    continue
+                final_embed, _file_attachment = result
+                embeds.append(final_embed)
 
-            except Exception as e:
-                logger.error(f"Error processing line: {e}")
-                continue
+        # Non-player events follow the connection events
+        embeds.extend(non_player_embeds)
 
         # Update voice channel once at the end if needed
         if voice_channel_needs_update:
-            await self.update_voice_channel(str(guild_id))
+            await self.update_voice_channel(guild_id)
 
         if not cold_start:
             logger.info(f"🔍 Generated {len(embeds)} events")
@@ -573,44 +1019,19 @@ class UnifiedLogParser:
     async def create_mission_embed(self, mission_id: str, state: str, respawn_time: Optional[int] = None) -> Optional[discord.Embed]:
         """Create mission embed"""
         try:
-            mission_level = self.get_mission_level(mission_id)
-
-            if state == 'READY':
-                embed = EmbedFactory.create_mission_embed(
-                    title="Mission Available",
-                    description="New mission objective is ready for deployment",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="READY"
-                )
-            elif state == 'IN_PROGRESS':
-                embed = EmbedFactory.create_mission_embed(
-                    title="Mission In Progress",
-                    description="Mission objective is currently being completed",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="IN_PROGRESS"
-                )
-            elif state == 'COMPLETED':
-                embed = EmbedFactory.create_mission_embed(
-                    title="Mission Completed",
-                    description="Mission objective has been successfully completed",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="COMPLETED"
-                )
-            elif state == 'RESPAWN' and respawn_time:
-                embed = EmbedFactory.create_mission_embed(
-                    title="Mission Respawning",
-                    description="Mission objective is preparing for redeployment",
-                    mission_id=mission_id,
-                    level=mission_level,
-                    state="RESPAWN",
-                    respawn_time=respawn_time
-                )
-            else:
+            copy = self._MISSION_STATES.get(state)
+            if copy is None or (state == 'RESPAWN' and not respawn_time):
                 return None
 
+            title, description = copy
+            embed = EmbedFactory.create_mission_embed(
+                title=title,
+                description=description,
+                mission_id=mission_id,
+                level=self.get_mission_level(mission_id),
+                state=state,
+                respawn_time=respawn_time if state == 'RESPAWN' else None
+            )
             return embed
 
         except Exception as e:
@@ -665,7 +1086,7 @@ class UnifiedLogParser:
             # Convert guild_id to int with better validation
             if isinstance(guild_id, str):
                 # Skip if it's a MongoDB ObjectId
-                if len(guild_id) == 24 and all(c in '0123456789abcdef' for c in guild_id.lower()):
+                if _OBJECTID_RE.fullmatch(guild_id):
                     logger.debug(f"Skipping voice update for MongoDB ObjectId: {guild_id}")
                     return
                 try:
@@ -676,28 +1097,37 @@ class UnifiedLogParser:
             else:
                 guild_id_int = guild_id
 
-            # Count active players with better key validation
-            guild_prefix = f"{guild_id}_"
-            active_players = 0
-            queued_players = 0
+            guild_key = str(guild_id)
+            active_players = self._online_counts[guild_key]
+            queued_players = self._queued_counts[guild_key]
 
-            for key, session in self.player_sessions.items():
-                if key.startswith(guild_prefix) and isinstance(session, dict) and session.get('status') == 'online':
-                    active_players += 1
+            logger.debug(f"Counted {active_players} active players and {queued_players} queued for guild {guild_id_int}")
 
-            # Count queued players (those in 'queued' state but not joined)
-            for key, lifecycle in self.player_lifecycle.items():
-                if key.startswith(guild_prefix) and lifecycle.get('state') == 'queued':
-                    queued_players += 1
+            # Nothing to do if the counts are what the channel already shows
+            vc_state = (active_players, queued_players)
+            if self._vc_last_state.get(guild_id_int) == vc_state:
+                return
 
-            logger.debug(f"Counted {active_players} active players and {queued_players} queued for guild {guild_id_int}")
+            # Renames are heavily rate limited - once the budget is spent, apply the
+            # latest counts when the oldest rename leaves the window, even if no
+            # further player events arrive
+            rename_times = self._vc_rename_times.get(guild_id_int, ())
+            if len(rename_times) >= VOICE_RENAMES_PER_WINDOW:
+                wait = rename_times[0] + VOICE_RENAME_WINDOW - time.monotonic()
+                if wait > 0:
+                    if guild_id_int not in self._vc_deferred_updates:
+                        self._vc_deferred_updates[guild_id_int] = asyncio.create_task(
+                            self._deferred_voice_update(guild_id_int, wait)
+                        )
+                    logger.debug(f"Voice channel rename budget for guild {guild_id_int} spent, deferring update")
+                    return
 
             # Get guild config with validation
             if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
                 logger.warning("Database manager not available for voice channel update")
                 return
 
-            guild_config = await self.bot.db_manager.get_guild(guild_id_int)
+            guild_config = await self._get_guild_cached(guild_id_int)
             if not guild_config:
                 logger.debug(f"No guild config found for {guild_id_int}")
                 return
@@ -710,7 +1140,7 @@ class UnifiedLogParser:
             if servers:
                 # Use first server's info for display (most common case is single server)
                 primary_server = servers[0]
-                server_name = primary_server.get('name', 'Server').replace(' Server', '').replace(' EU', '').replace(' US', '')
+                server_name = self._server_display_names.get(guild_id_int, server_name)
 
                 # Try to get MaxPlayerCount from database first, then fallback to config
                 try:
@@ -725,47 +1155,8 @@ class UnifiedLogParser:
                     logger.warning(f"Failed to get stored max players: {e}")
                     max_players = primary_server.get('max_players', 60)
 
-            # Find voice channel ID with comprehensive mapping
-            voice_channel_id = None
-
-            # Method 1: Check server_channels (new format)
-            server_channels = guild_config.get('server_channels', {})
-            for server_key, channels in server_channels.items():
-                if isinstance(channels, dict):
-                    # Try multiple voice channel key names
-                    for voice_key in ['voice_count', 'playercountvc', 'playercount']:
-                        if voice_key in channels:
-                            voice_channel_id = channels[voice_key]
-                            logger.debug(f"Found voice channel {voice_channel_id} as {voice_key} in server {server_key}")
-                            break
-                    if voice_channel_id:
-                        break
-
-            # Method 2: Check channels (legacy format)
-            if not voice_channel_id:
-                legacy_channels = guild_config.get('channels', {})
-                if isinstance(legacy_channels, dict):
-                    for voice_key in ['voice_count', 'playercountvc', 'playercount']:
-                        if voice_key in legacy_channels:
-                            voice_channel_id = legacy_channels[voice_key]
-                            logger.debug(f"Found legacy voice channel {voice_channel_id} as {voice_key}")
-                            break
-
-            # Method 3: Check if any servers have voice channels configured
-            if not voice_channel_id:
-                for server in servers:
-                    server_id = str(server.get('_id', ''))
-                    if server_id in server_channels:
-                        channels = server_channels[server_id]
-                        if isinstance(channels, dict):
-                            for voice_key in ['voice_count', 'playercountvc', 'playercount']:
-                                if voice_key in channels:
-                                    voice_channel_id = channels[voice_key]
-                                    logger.debug(f"Found voice channel {voice_channel_id} in server {server_id}")
-                                    break
-                        if voice_channel_id:
-                            break
-
+            # Resolved once per guild config fetch
+            voice_channel_id = self._voice_channel_ids.get(guild_id_int)
             if not voice_channel_id:
                 logger.debug(f"No voice channel configured for guild {guild_id_int}")
                 return
@@ -785,25 +1176,16 @@ class UnifiedLogParser:
                 logger.warning(f"Channel {voice_channel_id} is not a voice channel")
                 return
 
-            # Build voice channel name with specified format
-            queue_text = f" | {queued_players} in Queue" if queued_players > 0 else ""
-            new_name = f"{server_name} | {active_players}/{max_players}{queue_text}"
-
-            # Ensure name fits Discord's 100 character limit
-            if len(new_name) > 100:
-                # Truncate server name if needed
-                max_server_name_length = 100 - len(f"{status_emoji} : {active_players}/{max_players}{queue_text}")
-                if max_server_name_length > 0:
-                    server_name = server_name[:max_server_name_length]
-                    new_name = f"{status_emoji} {server_name}: {active_players}/{max_players}{queue_text}"
-                else:
-                    # Fallback to simple format
-                    new_name = f"{status_emoji} Players: {active_players}/{max_players}"
+            new_name = self._build_vc_name(server_name, active_players, max_players, queued_players)
 
             if voice_channel.name != new_name:
                 try:
                     # Direct voice channel update - no rate limiter needed for voice channels
                     await voice_channel.edit(name=new_name)
+                    self._vc_rename_times.setdefault(
+                        guild_id_int, deque(maxlen=VOICE_RENAMES_PER_WINDOW)
+                    ).append(time.monotonic())
+                    self._vc_last_state[guild_id_int] = vc_state
                     logger.info(f"✅ Voice channel updated to: {new_name}")
 
                 except discord.HTTPException as e:
@@ -814,12 +1196,119 @@ class UnifiedLogParser:
                 except Exception as edit_error:
                     logger.error(f"Error editing voice channel: {edit_error}")
             else:
+                self._vc_last_state[guild_id_int] = vc_state
                 logger.debug(f"Voice channel already has correct name: {new_name}")
 
         except Exception as e:
-            logger.error(f"Voice channel update failed: {e}")
-            import traceback
-            logger.error(f"Voice channel update traceback: {traceback.format_exc()}")
+            logger.exception(f"Voice channel update failed: {e}")
+
+    async def _deferred_voice_update(self, guild_id: int, delay: float):
+        """Update the voice channel with the then-current counts after delay seconds"""
+        await asyncio.sleep(delay)
+        self._vc_deferred_updates.pop(guild_id, None)
+        await self.update_voice_channel(str(guild_id))
+
+    @staticmethod
+    def _build_vc_name(display_name: str, active_players: int, max_players: int, queued_players: int) -> str:
+        """Build the player count channel name within Discord's 100 character limit"""
+        queue_text = f" | {queued_players} in Queue" if queued_players > 0 else ""
+        counts = f" | {active_players}/{max_players}{queue_text}"
+
+        # Truncate the server name rather than the counts
+        max_server_name_length = 100 - len(counts)
+        if max_server_name_length > 0:
+            return f"{display_name[:max_server_name_length]}{counts}"
+
+        # Fallback to simple format
+        return f"Players: {active_players}/{max_players}"[:100]
+
+    async def _get_guild_cached(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """Get guild config, serving it from memory for up to GUILD_CACHE_TTL seconds"""
+        cached = self._guild_cache.get(guild_id)
+        now = time.monotonic()
+        if cached and now - cached[0] < GUILD_CACHE_TTL:
+            return cached[1]
+
+        # Concurrent misses (e.g. one embed send per server) share a single read
+        fetch = self._guild_fetches.get(guild_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_guild_config(guild_id, now))
+            self._guild_fetches[guild_id] = fetch
+            fetch.add_done_callback(lambda done: self._forget_guild_fetch(guild_id, done))
+        return await asyncio.shield(fetch)
+
+    async def _fetch_guild_config(self, guild_id: int, fetched_at: float) -> Optional[Dict[str, Any]]:
+        """Read a guild config from MongoDB and cache it unless it was invalidated meanwhile"""
+        guild_config = await self.bot.db_manager.get_guild(guild_id)
+        # A config write during the read makes this result stale - return it, don't cache it
+        if self._guild_fetches.get(guild_id) is asyncio.current_task():
+            if guild_config:
+                self._cache_guild_config(guild_id, guild_config, fetched_at)
+            else:
+                self.invalidate_guild_cache(guild_id)
+        return guild_config
+
+    def _forget_guild_fetch(self, guild_id: int, fetch: asyncio.Future):
+        """Drop a finished guild config read unless a newer one has replaced it"""
+        if self._guild_fetches.get(guild_id) is fetch:
+            del self._guild_fetches[guild_id]
+
+    def _cache_guild_config(self, guild_id: int, guild_config: Dict[str, Any], fetched_at: float):
+        """Store a guild config and the values derived from it"""
+        self._guild_cache[guild_id] = (fetched_at, guild_config)
+        self._voice_channel_ids[guild_id] = self._resolve_voice_channel_id(guild_config)
+        servers = guild_config.get('servers', [])
+        self._servers_by_id[guild_id] = {str(server.get('_id', '')): server for server in servers}
+        display_name = None
+        if servers:
+            display_name = servers[0].get('name', 'Server').replace(' Server', '').replace(' EU', '').replace(' US', '')
+        if self._server_display_names.get(guild_id) != display_name:
+            # Renamed server - the voice channel needs re-rendering even if counts are unchanged
+            self._vc_last_state.pop(guild_id, None)
+        if display_name is None:
+            self._server_display_names.pop(guild_id, None)
+        else:
+            self._server_display_names[guild_id] = display_name
+
+    @staticmethod
+    def _resolve_voice_channel_id(guild_config: Dict[str, Any]) -> Optional[int]:
+        """Find the player count voice channel in a guild config (new, legacy, then per-server)"""
+        def first_voice_key(channels) -> Optional[int]:
+            # The first voice key present decides, even if it was cleared to None
+            if not isinstance(channels, dict):
+                return None
+            return next((channels[key] for key in ('voice_count', 'playercountvc', 'playercount') if key in channels), None)
+
+        # Method 1: Check server_channels (new format)
+        server_channels = guild_config.get('server_channels', {})
+        for channels in server_channels.values():
+            voice_channel_id = first_voice_key(channels)
+            if voice_channel_id:
+                return voice_channel_id
+
+        # Method 2: Check channels (legacy format)
+        voice_channel_id = first_voice_key(guild_config.get('channels', {}))
+        if voice_channel_id:
+            return voice_channel_id
+
+        # Method 3: Check if any servers have voice channels configured
+        for server in guild_config.get('servers', []):
+            voice_channel_id = first_voice_key(server_channels.get(str(server.get('_id', ''))))
+            if voice_channel_id:
+                return voice_channel_id
+
+        return None
+
+    def invalidate_guild_cache(self, guild_id: int):
+        """Drop the cached guild config after it has been written"""
+        guild_id = int(guild_id)
+        self._guild_cache.pop(guild_id, None)
+        self._guild_fetches.pop(guild_id, None)
+        self._voice_channel_ids.pop(guild_id, None)
+        self._server_display_names.pop(guild_id, None)
+        self._servers_by_id.pop(guild_id, None)
+        # Server name, capacity or channel may have changed - re-render the voice channel
+        self._vc_last_state.pop(guild_id, None)
 
     async def get_channel_for_type(self, guild_id: int, server_id: str, channel_type: str) -> Optional[int]:
         """Get channel ID with bulletproof fallback"""
@@ -827,7 +1316,7 @@ class UnifiedLogParser:
             if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
                 return None
 
-            guild_config = await self.bot.db_manager.get_guild(guild_id)
+            guild_config = await self._get_guild_cached(guild_id)
             if not guild_config:
                 return None
 
@@ -858,93 +1347,100 @@ class UnifiedLogParser:
             logger.error(f"Error getting channel: {e}")
             return None
 
-    async def send_embeds(self, guild_id: int, server_id: str, embeds: List[discord.Embed]):
+    @staticmethod
+    def _embed_build_data(embed: discord.Embed) -> Dict[str, Any]:
+        """Extract EmbedFactory.build data from a parsed embed"""
+        embed_data = {
+            'title': embed.title,
+            'description': embed.description,
+            'mission_id': '',
+            'level': 1,
+            'state': 'UNKNOWN',
+            'player_name': 'Unknown',
+            'player_id': 'Unknown',
+            'location': 'Unknown'
+        }
+
+        # Extract data from embed fields if available
+        for field in embed.fields:
+            key = UnifiedLogParser._EMBED_FIELD_MAP.get(field.name.lower())
+            if key:
+                embed_data[key] = field.value.upper() if key == 'state' else field.value
+
+        return embed_data
+
+    async def send_embeds(self, guild_id: int, server_id: str, embeds: List[discord.Embed],
+                          categories: Optional[List[str]] = None):
         """Send embeds to appropriate channels with proper file attachments"""
         if not embeds:
             return
 
-        try:
-            for embed in embeds:
-                # Determine channel type and embed type
-                channel_type = 'events'
-                embed_type = 'general'
-
-                if embed.title:
-                    title_lower = embed.title.lower()
-                    if any(word in title_lower for word in ['connect', 'disconnect', 'join', 'left']):
-                        channel_type = 'connections'
-                        embed_type = 'connection'
-                    elif 'mission' in title_lower:
-                        embed_type = 'mission'
-                    elif 'airdrop' in title_lower:
-                        embed_type = 'airdrop'
-                    elif 'helicrash' in title_lower or 'helicopter' in title_lower:
-                        embed_type = 'helicrash'
-                    elif 'trader' in title_lower:
-                        embed_type = 'trader'
-
-                # Get channel
-                channel_id = await self.get_channel_for_type(guild_id, server_id, channel_type)
-                if not channel_id:
-                    continue
+        if categories is None:
+            categories = [_classify_embed_title(embed.title) for embed in embeds]
 
-                channel = self.bot.get_channel(channel_id)
+        try:
+            # Resolve each channel type once for the whole batch
+            channel_types = ['connections' if embed_type == 'connection' else 'events' for embed_type in categories]
+            unique_types = list(dict.fromkeys(channel_types))
+            resolved = await asyncio.gather(
+                *(self.get_channel_for_type(guild_id, server_id, channel_type) for channel_type in unique_types)
+            )
+            channels = {}
+            for channel_type, channel_id in zip(unique_types, resolved):
+                channel = self.bot.get_channel(channel_id) if channel_id else None
                 if channel:
-                    try:
-                        # Build proper embed with attachment using EmbedFactory
-                        embed_data = {
-                            'title': embed.title,
-                            'description': embed.description,
-                            'mission_id': '',
-                            'level': 1,
-                            'state': 'UNKNOWN',
-                            'player_name': 'Unknown',
-                            'player_id': 'Unknown',
-                            'location': 'Unknown'
-                        }
+                    channels[channel_type] = channel
+
+            pending = [
+                (channels[channel_type], embed, embed_type)
+                for embed, embed_type, channel_type in zip(embeds, categories, channel_types)
+                if channel_type in channels
+            ]
+            if not pending:
+                return
 
-                        # Extract data from embed fields if available
-                        for field in embed.fields:
-                            if field.name.lower() == 'mission':
-                                embed_data['mission_id'] = field.value
-                            elif field.name.lower() == 'player':
-                                embed_data['player_name'] = field.value
-                            elif field.name.lower() == 'location':
-                                embed_data['location'] = field.value
-                            elif field.name.lower() == 'status':
-                                embed_data['state'] = field.value.upper()
-
-                        # Use EmbedFactory to build with proper attachment
-                        final_embed, file_attachment = await EmbedFactory.build(embed_type, embed_data)
-
-                        # Set priority for rate limiter
-                        from bot.utils.advanced_rate_limiter import MessagePriority
-                        priority = MessagePriority.NORMAL
-                        if embed.title:
-                            title_lower = embed.title.lower()
-                            if any(word in title_lower for word in ['connect', 'disconnect']):
-                                priority = MessagePriority.HIGH
-                            elif 'mission' in title_lower and 'ready' in title_lower:
-                                priority = MessagePriority.HIGH
-
-                        # Send with rate limiter if available
-                        if hasattr(self.bot, 'advanced_rate_limiter'):
-                            await self.bot.advanced_rate_limiter.queue_message(
-                                channel_id=channel.id,
-                                embed=final_embed,
-                                file=file_attachment,
-                                priority=priority
-                            )
-                        else:
-                            # Fallback to direct send
-                            if file_attachment:
-                                await channel.send(embed=final_embed, file=file_attachment)
-                            else:
-                                await channel.send(embed=final_embed)
+            # Build all embeds with their attachments concurrently
+            built = await asyncio.gather(
+                *(EmbedFactory.build(embed_type, self._embed_build_data(embed)) for _, embed, embed_type in pending),
+                return_exceptions=True
+            )
 
+            queued = []
+            for (channel, embed, embed_type), result in zip(pending, built):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to send embed: {result}")
+                    continue
+                final_embed, file_attachment = result
+
+                # Set priority for rate limiter
+                priority = MessagePriority.NORMAL
+                if embed_type == 'connection':
+                    priority = MessagePriority.HIGH
+                elif embed_type == 'mission' and 'ready' in embed.title.lower():
+                    priority = MessagePriority.HIGH
+
+                if hasattr(self.bot, 'advanced_rate_limiter'):
+                    queued.append(self.bot.advanced_rate_limiter.queue_message(
+                        channel_id=channel.id,
+                        embed=final_embed,
+                        file=file_attachment,
+                        priority=priority
+                    ))
+                else:
+                    # Fallback to direct send, one at a time to keep channel order
+                    try:
+                        if file_attachment:
+                            await channel.send(embed=final_embed, file=file_attachment)
+                        else:
+                            await channel.send(embed=final_embed)
                     except Exception as e:
                         logger.error(f"Failed to send embed: {e}")
 
+            # queue_message only enqueues, so submitting together keeps embed order
+            for result in await asyncio.gather(*queued, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to send embed: {result}")
+
         except Exception as e:
             logger.error(f"Error sending embeds: {e}")
 
@@ -961,46 +1457,34 @@ class UnifiedLogParser:
                 logger.warning(f"❌ Invalid server config: {server_name}")
                 return
 
-            # Get log content
-            content = await self.get_log_content(server)
-            if not content:
+            # Get log content (only new data once a byte offset is known)
+            server_key = f"{guild_id}_{server_id}"
+            content, is_delta = await self.get_log_content(server, server_key)
+            if content is None:
                 logger.warning(f"❌ No log content for {server_name}")
                 return
+            if not content:
+                logger.info(f"✅ {server_name}: No new log data")
+                return
 
             # Determine if cold start
-            server_key = f"{guild_id}_{server_id}"
             file_state = self.file_states.get(server_key, {})
             is_cold_start = not file_state.get('cold_start_complete', False)
 
             # Parse content with server context
-            embeds = await self.parse_log_content(content, str(guild_id), server_id, is_cold_start, server_name)
+            embeds = await self.parse_log_content(content, str(guild_id), server_id, is_cold_start, server_name, is_delta)
 
-            # Send embeds (only if not cold start)
             if not is_cold_start and embeds:
-                await self.send_embeds(guild_id, server_id, embeds)
-
-            # Log combined event summary
-            if not is_cold_start and embeds:
-                event_types = {}
-                connection_events = 0
-                for embed in embeds:
-                    if embed.title:
-                        title_lower = embed.title.lower()
-                        if any(word in title_lower for word in ['connect', 'disconnect', 'join', 'left']):
-                            connection_events += 1
-                        elif 'mission' in title_lower:
-                            event_types['missions'] = event_types.get('missions', 0) + 1
-                        elif 'airdrop' in title_lower:
-                            event_types['airdrops'] = event_types.get('airdrops', 0) + 1
-                        elif 'helicrash' in title_lower:
-                            event_types['helicrashes'] = event_types.get('helicrashes', 0) + 1
-                        elif 'trader' in title_lower:
-                            event_types['traders'] = event_types.get('traders', 0) + 1
-
-                if connection_events:
-                    event_types['connections'] = connection_events
-
-                event_summary = ", ".join([f"{count} {type_name}" for type_name, count in event_types.items()])
+                # Classify once; both sending and the summary below use it
+                categories = [_classify_embed_title(embed.title) for embed in embeds]
+                await self.send_embeds(guild_id, server_id, embeds, categories)
+
+                # Log combined event summary
+                category_counts = Counter(categories)
+                event_summary = ", ".join(
+                    f"{category_counts[category]} {type_name}"
+                    for category, type_name in self._SUMMARY_KEYS.items() if category_counts[category]
+                )
                 logger.info(f"✅ {server_name}: {len(embeds)} total events sent ({event_summary})")
             else:
                 logger.info(f"✅ {server_name}: {'Cold start' if is_cold_start else 'No new events'}")
@@ -1017,17 +1501,19 @@ class UnifiedLogParser:
                 logger.error("❌ Database not available")
                 return
 
-            # Get all guilds
-            guilds_cursor = self.bot.db_manager.guilds.find({})
-            guilds_list = await guilds_cursor.to_list(length=None)
+            # SFTP reads dominate, so servers are parsed concurrently up to a limit
+            semaphore = asyncio.Semaphore(PARSER_CONCURRENCY)
 
-            if not guilds_list:
-                logger.info("No guilds found")
-                return
-
-            total_processed = 0
+            async def parse_server(guild_id: int, server: dict):
+                async with semaphore:
+                    await self.parse_server_logs(guild_id, server)
 
-            for guild_doc in guilds_list:
+            # Stream all guilds - each guild's servers start while later batches load
+            guild_count = 0
+            server_tasks = []
+            guilds_cursor = self.bot.db_manager.guilds.find({}).batch_size(GUILD_CURSOR_BATCH_SIZE)
+            async for guild_doc in guilds_cursor:
+                guild_count += 1
                 guild_id = guild_doc.get('guild_id')
                 if not guild_id:
                     continue
@@ -1037,6 +1523,10 @@ class UnifiedLogParser:
                 except:
                     continue
 
+                # The guild documents are the guild configs - cache them so the
+                # per-server channel and voice lookups don't re-read them
+                self._cache_guild_config(guild_id, guild_doc, time.monotonic())
+
                 guild_name = guild_doc.get('name', f'Guild {guild_id}')
                 servers = guild_doc.get('servers', [])
 
@@ -1044,16 +1534,24 @@ class UnifiedLogParser:
                     continue
 
                 logger.info(f"📡 Processing {len(servers)} servers for {guild_name}")
+                server_tasks.extend(asyncio.ensure_future(parse_server(guild_id, server)) for server in servers)
 
-                for server in servers:
-                    try:
-                        await self.parse_server_logs(guild_id, server)
-                        total_processed += 1
-                    except Exception as e:
-                        logger.error(f"Server parse error: {e}")
+            if not guild_count:
+                logger.info("No guilds found")
+                return
+
+            total_processed = 0
+            for result in await asyncio.gather(*server_tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"Server parse error: {result}")
+                else:
+                    total_processed += 1
 
             logger.info(f"✅ Parser completed: {total_processed} servers processed")
 
+            # One state write per cycle instead of one per server
+            await self.flush_persistent_state()
+
         except Exception as e:
             logger.error(f"Parser run failed: {e}")
 
@@ -1061,50 +1559,149 @@ class UnifiedLogParser:
         """Load state from database"""
         try:
             if hasattr(self.bot, 'db_manager') and self.bot.db_manager:
-                state_doc = await self.bot.db_manager.db['parser_state'].find_one({'_id': 'unified_parser_state'})
+                state_doc = await self.bot.db_manager.db['parser_state'].find_one(
+                    {'_id': 'unified_parser_state'},
+                    {'file_states': 1}
+                )
                 if state_doc and 'file_states' in state_doc:
                     self.file_states = state_doc['file_states']
+                    # Resume SFTP tails from the persisted byte offsets
+                    for server_key, file_state in self.file_states.items():
+                        if file_state.get('byte_offset') is not None:
+                            self.last_log_position[server_key] = file_state['byte_offset']
                     logger.info(f"✅ Loaded state for {len(self.file_states)} servers")
         except Exception as e:
             logger.error(f"State load failed: {e}")
 
-    async def _save_persistent_state(self):
-        """Save state to database"""
+    async def _save_persistent_state(self, changed_keys: Optional[Iterable[str]] = None) -> bool:
+        """Save state to database - only the given servers' file states, or everything"""
         try:
             if hasattr(self.bot, 'db_manager') and self.bot.db_manager:
-                state_doc = {
-                    '_id': 'unified_parser_state',
-                    'file_states': self.file_states,
-                    'last_updated': datetime.now(timezone.utc).isoformat()
+                collection = self.bot.db_manager.db['parser_state']
+                last_updated = datetime.now(timezone.utc).isoformat()
+
+                if changed_keys is None:
+                    await collection.replace_one(
+                        {'_id': 'unified_parser_state'},
+                        {
+                            '_id': 'unified_parser_state',
+                            'file_states': self.file_states,
+                            'last_updated': last_updated
+                        },
+                        upsert=True
+                    )
+                    return True
+
+                updates = {
+                    f'file_states.{key}': self.file_states[key]
+                    for key in changed_keys if key in self.file_states
                 }
-                await self.bot.db_manager.db['parser_state'].replace_one(
+                updates['last_updated'] = last_updated
+                await collection.update_one(
                     {'_id': 'unified_parser_state'},
-                    state_doc,
+                    {'$set': updates},
                     upsert=True
                 )
+                return True
         except Exception as e:
             logger.error(f"State save failed: {e}")
+        return False
+
+    async def flush_persistent_state(self):
+        """Save state if it changed since the last save"""
+        replace = self._state_needs_replace
+        if not replace and not self._dirty_file_states:
+            return
+
+        # Take the pending changes first so changes made during the save are flushed next time
+        changed_keys = self._dirty_file_states
+        self._dirty_file_states = set()
+        self._state_needs_replace = False
+
+        if not await self._save_persistent_state(None if replace else changed_keys):
+            self._dirty_file_states |= changed_keys
+            self._state_needs_replace = self._state_needs_replace or replace
+
+    async def _state_flusher(self):
+        """Background write-behind loop for parser state"""
+        while True:
+            await asyncio.sleep(STATE_FLUSH_INTERVAL)
+            try:
+                await self.flush_persistent_state()
+            except Exception as e:
+                logger.error(f"State flush failed: {e}")
+
+    async def _tentative_name_sweeper(self):
+        """Background loop re-checking temporary player names in one query per guild"""
+        while True:
+            await asyncio.sleep(TENTATIVE_NAME_SWEEP_INTERVAL)
+            try:
+                await self._sweep_tentative_names()
+            except Exception as e:
+                logger.error(f"Tentative name sweep failed: {e}")
+
+    async def _sweep_tentative_names(self):
+        """Resolve temporary player names that have since appeared in pvp_data"""
+        if not self._tentative_ids or not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
+            return
+
+        tentative_ids = self._tentative_ids
+        self._tentative_ids = defaultdict(set)
+
+        for guild_id, player_ids in tentative_ids.items():
+            cursor = self.bot.db_manager.pvp_data.find(
+                {'guild_id': guild_id, 'player_id': {'$in': list(player_ids)}},
+                projection={'player_id': 1, 'player_name': 1}
+            )
+            async for pvp_doc in cursor:
+                name = pvp_doc.get('player_name')
+                if _is_real_name(name):
+                    cache_key = (str(guild_id), pvp_doc['player_id'])
+                    self.player_name_cache[cache_key] = name
+                    self._unresolved_names.pop(cache_key, None)
+                    player_ids.discard(pvp_doc['player_id'])
+
+            # Still unknown - keep checking until the temporary name expires
+            now = time.monotonic()
+            for player_id in player_ids:
+                unresolved = self._unresolved_names.get((str(guild_id), player_id))
+                if unresolved and unresolved[0] > now:
+                    self._tentative_ids[guild_id].add(player_id)
+
+    def _set_lifecycle_state(self, player_key: Tuple[str, str], state: str):
+        """Move a player to a lifecycle state, keeping the guild's queued count in step"""
+        previous = self.lc_state.get(player_key)
+        if previous == state:
+            return
+        if previous == 'queued':
+            self._queued_counts[player_key[0]] -= 1
+        elif state == 'queued':
+            self._queued_counts[player_key[0]] += 1
+        self.lc_state[player_key] = state
+
+    def _set_session_status(self, player_key: Tuple[str, str], status: str):
+        """Set a player's session status, keeping the guild's online count in step"""
+        previous = self.session_status.get(player_key)
+        if previous == status:
+            return
+        if previous is None:
+            self._session_players_by_prefix[(player_key[0], player_key[1][:8])].add(player_key[1])
+        if previous == 'online':
+            self._online_counts[player_key[0]] -= 1
+        elif status == 'online':
+            self._online_counts[player_key[0]] += 1
+        self.session_status[player_key] = status
 
     def get_parser_status(self) -> Dict[str, Any]:
         """Get parser status"""
         try:
-            active_sessions = sum(1 for session in self.player_sessions.values() if session.get('status') == 'online')
-
-            # Calculate active players by guild
-            active_players_by_guild = {}
-            for key, session in self.player_sessions.items():
-                if session.get('status') == 'online':
-                    guild_id = session.get('guild_id', 'unknown')
-                    active_players_by_guild[guild_id] = active_players_by_guild.get(guild_id, 0) + 1
-
-            # Check SFTP connection status
-            active_connections = 0
-            for conn in self.sftp_connections.values():
-                try:
-                    if not conn.is_closed():
-                        active_connections += 1
-                except:
-                    pass
+            active_players_by_guild = {
+                guild_id: count for guild_id, count in self._online_counts.items() if count
+            }
+            active_sessions = sum(active_players_by_guild.values())
+
+            # Maintained by _track_sftp_connection as connections open and close
+            active_connections = self._active_sftp_count
 
             return {
                 'active_sessions': active_sessions,
@@ -1129,10 +1726,22 @@ class UnifiedLogParser:
         """Reset all parser state"""
         try:
             self.file_states.clear()
-            self.player_sessions.clear()
-            self.player_lifecycle.clear()
+            self._dirty_file_states.clear()
+            self._state_needs_replace = True
+            for player_state in (self.lc_name, self.lc_platform, self.lc_state, self.lc_queued_at,
+                                 self.lc_joined_at, self.lc_disconnected_at, self.session_status,
+                                 self.session_joined_at, self.session_left_at):
+                player_state.clear()
+            self._online_counts.clear()
+            self._queued_counts.clear()
+            self._session_players_by_prefix.clear()
             self.last_log_position.clear()
             self.log_file_hashes.clear()
+            self._vc_last_state.clear()
+            # Rename times are kept - Discord's budget doesn't restart with the parser
+            for deferred_update in self._vc_deferred_updates.values():
+                deferred_update.cancel()
+            self._vc_deferred_updates.clear()
             if hasattr(self, 'server_status'):
                 self.server_status.clear()
             logger.info("✅ Parser state reset")
@@ -1141,37 +1750,54 @@ class UnifiedLogParser:
 
     async def resolve_player_name(self, player_id: str, guild_id: str) -> str:
         """ENHANCED player name resolution - NO UNKNOWN PLAYERS ALLOWED"""
+        # Concurrent lookups for the same player share one resolution
+        cache_key = (str(guild_id), player_id)
+        resolution = self._inflight_resolutions.get(cache_key)
+        if resolution is None:
+            resolution = asyncio.ensure_future(self._resolve_player_name(player_id, guild_id))
+            self._inflight_resolutions[cache_key] = resolution
+            resolution.add_done_callback(lambda _: self._inflight_resolutions.pop(cache_key, None))
+        # Shielded so one cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(resolution)
+
+    async def _resolve_player_name(self, player_id: str, guild_id: str) -> str:
+        """Run the name resolution pipeline: cache, lifecycle, database, sessions, temporary name"""
         try:
             # Check cache first
-            cache_key = f"{guild_id}_{player_id}"
+            cache_key = (str(guild_id), player_id)
             if cache_key in self.player_name_cache:
                 cached_name = self.player_name_cache[cache_key]
                 if not cached_name.startswith('Player_') and cached_name != 'Unknown Player':
                     return cached_name
 
+            # Recently failed - don't rerun the whole lookup pipeline yet
+            unresolved = self._unresolved_names.get(cache_key)
+            if unresolved and time.monotonic() < unresolved[0]:
+                return unresolved[1]
+
             # Method 1: Check current session lifecycle (most recent and most reliable)
-            lifecycle_key = f"{guild_id}_{player_id}"
-            if lifecycle_key in self.player_lifecycle:
-                name = self.player_lifecycle[lifecycle_key].get('name')
+            # Name caches share the session (guild_id, player_id) key
+            player_key = cache_key
+            if player_key in self.lc_name:
+                name = self.lc_name[player_key]
                 if name and name.strip() and name != 'Unknown Player':
                     # Advanced name cleaning and normalization
-                    import urllib.parse
-                    import re
                     try:
-                        # Multiple rounds of URL decoding
+                        # Multiple rounds of URL decoding (only escaped names need it)
                         decoded_name = name
-                        for _ in range(3):  # Handle double/triple encoding
-                            try:
-                                new_decoded = urllib.parse.unquote(decoded_name)
-                                if new_decoded == decoded_name:
+                        if '%' in name:
+                            for _ in range(3):  # Handle double/triple encoding
+                                try:
+                                    new_decoded = urllib.parse.unquote(decoded_name)
+                                    if new_decoded == decoded_name:
+                                        break
+                                    decoded_name = new_decoded
+                                except:
                                     break
-                                decoded_name = new_decoded
-                            except:
-                                break
 
                         # Clean up artifacts and normalize
                         clean_name = decoded_name.replace('+', ' ').replace('%20', ' ')
-                        clean_name = re.sub(r'[^\w\s\-_\[\]().]', '', clean_name).strip()
+                        clean_name = _NAME_CLEAN_RE.sub('', clean_name).strip()
 
                         if clean_name and len(clean_name) >= 2 and clean_name != 'Unknown Player':
                             self.player_name_cache[cache_key] = clean_name
@@ -1182,51 +1808,67 @@ class UnifiedLogParser:
 
             # Method 2: Enhanced database lookup with fuzzy matching
             if hasattr(self.bot, 'db_manager') and self.bot.db_manager:
+                guild_id_int = int(guild_id)
+                now = datetime.now(timezone.utc)
+
+                # Start the 2e kill event lookup now so its round trip overlaps 2a-2d
+                kill_lookup = asyncio.ensure_future(
+                    self._recent_kill_names(guild_id_int, player_id, now - timedelta(days=1), 10)
+                )
                 try:
-                    # 2a: Exact PvP data match
-                    pvp_doc = await self.bot.db_manager.pvp_data.find_one({
-                        'guild_id': int(guild_id),
-                        'player_id': player_id
-                    })
+                    # 2a: Exact PvP data match (batched with other lookups for this guild)
+                    pvp_doc = await self._lookup_pvp_doc(guild_id_int, player_id)
 
                     if pvp_doc:
                         name = pvp_doc.get('player_name')
-                        if name and name.strip() and name != 'Unknown Player' and not name.startswith('Player_'):
+                        if _is_real_name(name):
                             self.player_name_cache[cache_key] = name
                             logger.info(f"✅ Resolved player name from PvP data: {player_id} -> {name}")
                             return name
 
-                    # 2b: Multiple partial ID matching strategies
-                    for prefix_length in [12, 8, 6, 4]:
-                        if len(player_id) >= prefix_length:
-                            partial_id = player_id[:prefix_length]
-                            pvp_cursor = self.bot.db_manager.pvp_data.find({
-                                'guild_id': int(guild_id),
-                                'player_id': {'$regex': f'^{partial_id}', '$options': 'i'}
-                            }).sort('last_updated', -1).limit(5)
-
-                            async for pvp_doc in pvp_cursor:
-                                name = pvp_doc.get('player_name')
-                                if name and name.strip() and name != 'Unknown Player' and not name.startswith('Player_'):
-                                    self.player_name_cache[cache_key] = name
-                                    logger.info(f"✅ Resolved player name from partial ID ({prefix_length}): {player_id} -> {name}")
-                                    # Update record with full player_id
-                                    try:
-                                        await self.bot.db_manager.pvp_data.update_one(
-                                            {'_id': pvp_doc['_id']},
-                                            {'$set': {'player_id': player_id, 'last_updated': datetime.now(timezone.utc)}}
-                                        )
-                                    except:
-                                        pass
-                                    return name
+                    # 2b: Partial ID matching - longest prefix first, so a closer match is
+                    # never crowded out by newer documents sharing only a short prefix
+                    for prefix_length in (12, 8, 6, 4):
+                        if len(player_id) < prefix_length:
+                            continue
+                        partial_id = player_id[:prefix_length]
+                        pvp_cursor = self.bot.db_manager.pvp_data.find(
+                            {
+                                'guild_id': guild_id_int,
+                                'player_id': {'$regex': f'^{re.escape(partial_id)}'}
+                            },
+                            projection={'player_name': 1, 'player_id': 1}
+                        ).sort('last_updated', -1).limit(5)
+                        pvp_doc = None
+                        async for candidate in pvp_cursor:
+                            if _is_real_name(candidate.get('player_name')):
+                                pvp_doc = candidate
+                                break
+
+                        if pvp_doc:
+                            name = pvp_doc['player_name']
+                            self.player_name_cache[cache_key] = name
+                            logger.info(f"✅ Resolved player name from partial ID ({prefix_length}): {player_id} -> {name}")
+                            # Update record with full player_id
+                            try:
+                                await self.bot.db_manager.pvp_data.update_one(
+                                    {'_id': pvp_doc['_id']},
+                                    {'$set': {'player_id': player_id, 'last_updated': now}}
+                                )
+                            except:
+                                pass
+                            return name
 
                     # 2c: Check all recent PvP activity (last 7 days) for pattern matching
-                    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-                    recent_cursor = self.bot.db_manager.pvp_data.find({
-                        'guild_id': int(guild_id),
-                        'last_updated': {'$gte': week_ago},
-                        'player_name': {'$exists': True, '$ne': None}
-                    }).sort('last_updated', -1).limit(100)
+                    week_ago = now - timedelta(days=7)
+                    recent_cursor = self.bot.db_manager.pvp_data.find(
+                        {
+                            'guild_id': guild_id_int,
+                            'last_updated': {'$gte': week_ago},
+                            'player_name': {'$exists': True, '$ne': None, '$not': re.compile(r'^Player_')}
+                        },
+                        projection={'player_name': 1, 'player_id': 1}
+                    ).sort('last_updated', -1).limit(100)
 
                     async for pvp_doc in recent_cursor:
                         doc_player_id = pvp_doc.get('player_id', '')
@@ -1249,10 +1891,10 @@ class UnifiedLogParser:
                                 return name
 
                     # 2d: Check linked players with expanded search
-                    player_doc = await self.bot.db_manager.players.find_one({
-                        'guild_id': int(guild_id),
-                        'player_id': player_id
-                    })
+                    player_doc = await self.bot.db_manager.players.find_one(
+                        {'guild_id': guild_id_int, 'player_id': player_id},
+                        projection={'primary_character': 1, 'linked_characters': 1}
+                    )
 
                     if player_doc:
                         name = player_doc.get('primary_character') or (player_doc.get('linked_characters', [None])[0])
@@ -1262,46 +1904,35 @@ class UnifiedLogParser:
                             return name
 
                     # 2e: Cross-reference with kill events in the last 24 hours
-                    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
-                    kill_cursor = self.bot.db_manager.kill_events.find({
-                        'guild_id': int(guild_id),
-                        'timestamp': {'$gte': yesterday},
-                        '$or': [
-                            {'killer_id': player_id},
-                            {'victim_id': player_id}
-                        ]
-                    }).sort('timestamp', -1).limit(10)
-
-                    async for kill_event in kill_cursor:
-                        if kill_event.get('killer_id') == player_id:
-                            name = kill_event.get('killer')
-                        elif kill_event.get('victim_id') == player_id:
-                            name = kill_event.get('victim')
-                        else:
-                            continue
-
-                        if name and name.strip() and name != 'Unknown Player' and not name.startswith('Player_'):
+                    for name in await kill_lookup:
+                        if _is_real_name(name):
                             self.player_name_cache[cache_key] = name
                             logger.info(f"✅ Resolved player name from kill events: {player_id} -> {name}")
                             return name
 
                 except Exception as db_error:
                     logger.error(f"Database lookup failed for player {player_id}: {db_error}")
+                finally:
+                    # Resolved before 2e - drop the prefetch without leaving an unretrieved error
+                    if not kill_lookup.done():
+                        kill_lookup.cancel()
+                    elif not kill_lookup.cancelled():
+                        kill_lookup.exception()
 
             # Method 3: Check other active sessions for similar player IDs
-            for session_key, session in self.player_sessions.items():
-                if session_key.startswith(f"{guild_id}_") and session.get('status') == 'online':
-                    session_player_id = session.get('player_id', '')
-                    session_player_name = session.get('player_name', '')
-
-                    if session_player_id and session_player_name and not session_player_name.startswith('Player_'):
-                        # Check for ID similarity (they might be similar players)
-                        if len(session_player_id) >= 8 and len(player_id) >= 8:
-                            if session_player_id[:8] == player_id[:8]:
-                                # Very similar IDs, might be same player with ID variation
-                                logger.info(f"✅ Resolved player name from similar session: {player_id} -> {session_player_name}")
-                                self.player_name_cache[cache_key] = session_player_name
-                                return session_player_name
+            if len(player_id) >= 8:
+                guild_key = str(guild_id)
+                for session_player_id in self._session_players_by_prefix.get((guild_key, player_id[:8]), ()):
+                    session_key = (guild_key, session_player_id)
+                    if self.session_status.get(session_key) != 'online':
+                        continue
+
+                    session_player_name = self.lc_name.get(session_key, '')
+                    if session_player_name and not session_player_name.startswith('Player_'):
+                        # Very similar IDs, might be same player with ID variation
+                        logger.info(f"✅ Resolved player name from similar session: {player_id} -> {session_player_name}")
+                        self.player_name_cache[cache_key] = session_player_name
+                        return session_player_name
 
             # Method 4: Last resort - create a meaningful temporary name and try to resolve later
             # Generate a more user-friendly temporary name
@@ -1311,13 +1942,11 @@ class UnifiedLogParser:
                 suffix = player_id[-4:].upper()
                 temp_name = f"Player{prefix}{suffix}"
 
-                # Store in cache but mark it as temporary
-                self.player_name_cache[cache_key] = temp_name
-
-                # Schedule a delayed lookup attempt
-                asyncio.create_task(self._delayed_name_resolution(player_id, guild_id, cache_key))
+                # Remember the miss briefly; the first lookup after it expires resolves again
+                self._unresolved_names[cache_key] = (time.monotonic() + UNRESOLVED_NAME_TTL, temp_name)
+                self._tentative_ids[int(guild_id)].add(player_id)
 
-                logger.warning(f"⚠️ Using temporary name {temp_name} for player {player_id} - scheduling delayed resolution")
+                logger.warning(f"⚠️ Using temporary name {temp_name} for player {player_id} - retrying after {UNRESOLVED_NAME_TTL}s")
                 return temp_name
 
             # Absolute fallback
@@ -1328,58 +1957,74 @@ class UnifiedLogParser:
             logger.error(f"Error in enhanced player name resolution for {player_id}: {e}")
             return f"Player{player_id[:8].upper()}" if len(player_id) >= 8 else "UnknownPlayer"
 
-    async def _delayed_name_resolution(self, player_id: str, guild_id: str, cache_key: str):
-        """Attempt to resolve player name after a delay (when more data might be available)"""
-        try:
-            # Wait 30 seconds for potential database updates
-            await asyncio.sleep(30)
-
-            # Try resolution again with database priority
-            if hasattr(self.bot, 'db_manager') and self.bot.db_manager:
-                # Check if player has appeared in recent PvP data
-                pvp_doc = await self.bot.db_manager.pvp_data.find_one({
-                    'guild_id': int(guild_id),
-                    'player_id': player_id
-                })
-
-                if pvp_doc:
-                    name = pvp_doc.get('player_name')
-                    if name and name.strip() and not name.startswith('Player_'):
-                        self.player_name_cache[cache_key] = name
-                        logger.info(f"✅ Delayed resolution successful: {player_id} -> {name}")
-                        return
-
-                # Check recent kill events again
-                recent = datetime.now(timezone.utc) - timedelta(minutes=10)
-                kill_cursor = self.bot.db_manager.kill_events.find({
-                    'guild_id': int(guild_id),
-                    'timestamp': {'$gte': recent},
-                    '$or': [
-                        {'killer_id': player_id},
-                        {'victim_id': player_id}
-                    ]
-                }).sort('timestamp', -1).limit(5)
-
-                async for kill_event in kill_cursor:
-                    if kill_event.get('killer_id') == player_id:
-                        name = kill_event.get('killer')
-                    elif kill_event.get('victim_id') == player_id:
-                        name = kill_event.get('victim')
-                    else:
-                        continue
+    async def _lookup_pvp_doc(self, guild_id: int, player_id: str) -> Optional[Dict[str, Any]]:
+        """Queue an exact pvp_data lookup; lookups arriving within the batch window share one query"""
+        pending = self._pvp_lookup_queue.get(guild_id)
+        if pending is None:
+            pending = self._pvp_lookup_queue[guild_id] = {}
+            asyncio.create_task(self._flush_pvp_lookups(guild_id))
+
+        lookup = pending.get(player_id)
+        if lookup is None:
+            lookup = pending[player_id] = asyncio.get_running_loop().create_future()
+        return await asyncio.shield(lookup)
+
+    async def _flush_pvp_lookups(self, guild_id: int):
+        """Resolve every queued pvp_data lookup for a guild with a single $in query"""
+        await asyncio.sleep(PVP_LOOKUP_BATCH_WINDOW)
+        pending = self._pvp_lookup_queue.pop(guild_id, {})
+        if not pending:
+            return
 
-                    if name and name.strip() and not name.startswith('Player_'):
-                        self.player_name_cache[cache_key] = name
-                        logger.info(f"✅ Delayed resolution from kills: {player_id} -> {name}")
-                        return
+        try:
+            docs = await self.bot.db_manager.pvp_data.find(
+                {'guild_id': guild_id, 'player_id': {'$in': list(pending)}},
+                projection={'player_id': 1, 'player_name': 1}
+            ).to_list(length=None)
+        except Exception as e:
+            for lookup in pending.values():
+                if not lookup.done():
+                    lookup.set_exception(e)
+            return
 
-            logger.debug(f"Delayed resolution failed for {player_id} - keeping temporary name")
+        found: Dict[str, Dict[str, Any]] = {}
+        for doc in docs:
+            found.setdefault(doc.get('player_id'), doc)
+        for player_id, lookup in pending.items():
+            if not lookup.done():
+                lookup.set_result(found.get(player_id))
+
+    async def _recent_kill_names(self, guild_id: int, player_id: str, since: datetime, limit: int) -> List[str]:
+        """Names the player used in their newest kill events, one covered query per role"""
+        async def role_kill_events(role: str) -> List[Dict[str, Any]]:
+            def query():
+                return self.bot.db_manager.kill_events.find(
+                    {'guild_id': guild_id, f'{role}_id': player_id, 'timestamp': {'$gte': since}},
+                    # Only fields in the index, so the server never fetches the event documents
+                    projection={'_id': 0, role: 1, 'timestamp': 1}
+                )
 
-        except Exception as e:
-            logger.error(f"Error in delayed name resolution: {e}")
+            try:
+                return await query().hint(
+                    [('guild_id', 1), (f'{role}_id', 1), ('timestamp', -1), (role, 1)]
+                ).sort('timestamp', -1).limit(limit).to_list(length=limit)
+            except OperationFailure as e:
+                # The hinted index is missing - let the planner pick one instead
+                logger.warning(f"⚠️ Kill name index for {role} unavailable, querying unhinted: {e}")
+                return await query().sort('timestamp', -1).limit(limit).to_list(length=limit)
+
+        role_events = await asyncio.gather(*(role_kill_events(role) for role in ('killer', 'victim')))
+
+        named_events = [
+            (event['timestamp'], event.get(role))
+            for role, events in zip(('killer', 'victim'), role_events)
+            for event in events
+        ]
+        named_events.sort(key=lambda item: item[0], reverse=True)
+        return [name for _, name in named_events[:limit]]
 
     async def _update_server_info(self, guild_id: str, server_id: str, max_players: Optional[int]):
-        """Update server information in database"""
+        """Queue a server information update, skipping values the config already has"""
         try:
             if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
                 return
@@ -1387,20 +2032,42 @@ class UnifiedLogParser:
             guild_id_int = int(guild_id)
             update_data = {}
 
-            if max_players:
+            if max_players and await self._get_server_max_players(guild_id_int, server_id) != max_players:
                 update_data['max_players'] = max_players
 
             if update_data:
-                # Update the guild's server configuration
-                await self.bot.db_manager.guilds.update_one(
-                    {
-                        "guild_id": guild_id_int,
-                        "servers._id": server_id
-                    },
-                    {
-                        "$set": {f"servers.$.{key}": value for key, value in update_data.items()}
-                    }
-                )
+                # Servers cold-starting together share one bulk write
+                self._pending_server_updates.append((guild_id_int, server_id, update_data))
+                if len(self._pending_server_updates) == 1:
+                    asyncio.create_task(self._flush_server_updates())
+
+        except Exception as e:
+            logger.error(f"Failed to update server info: {e}")
+
+    async def _flush_server_updates(self):
+        """Write queued server information updates with a single bulk_write"""
+        await asyncio.sleep(SERVER_UPDATE_BATCH_WINDOW)
+        pending = self._pending_server_updates
+        self._pending_server_updates = []
+
+        try:
+            await self.bot.db_manager.guilds.bulk_write(
+                [
+                    UpdateOne(
+                        {
+                            "guild_id": guild_id_int,
+                            "servers._id": server_id
+                        },
+                        {
+                            "$set": {f"servers.$.{key}": value for key, value in update_data.items()}
+                        }
+                    )
+                    for guild_id_int, server_id, update_data in pending
+                ],
+                ordered=False
+            )
+            for guild_id_int, server_id, update_data in pending:
+                self.invalidate_guild_cache(guild_id_int)
                 logger.info(f"✅ Updated server info for {server_id}: {update_data}")
 
         except Exception as e:
@@ -1412,16 +2079,12 @@ class UnifiedLogParser:
             if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
                 return None
 
-            guild_config = await self.bot.db_manager.get_guild(guild_id)
+            guild_config = await self._get_guild_cached(guild_id)
             if not guild_config:
                 return None
 
-            servers = guild_config.get('servers', [])
-            for server in servers:
-                if str(server.get('_id', '')) == str(server_id):
-                    return server.get('max_players')
-
-            return None
+            server = self._servers_by_id.get(guild_id, {}).get(str(server_id))
+            return server.get('max_players') if server else None
 
         except Exception as e:
             logger.error(f"Failed to get server max players: {e}")
@@ -1430,11 +2093,7 @@ class UnifiedLogParser:
     def get_active_player_count(self, guild_id: str) -> int:
         """Get active player count for a guild"""
         try:
-            guild_prefix = f"{guild_id}_"
-            return sum(
-                1 for key, session in self.player_sessions.items()
-                if key.startswith(guild_prefix) and isinstance(session, dict) and session.get('status') == 'online'
-            )
+            return self._online_counts[str(guild_id)]
         except Exception as e:
             logger.error(f"Error getting active player count: {e}")
             return 0
\ No newline at end of file
@@ -21,6 +21,11 @@ class MessagePriority(Enum):
     NORMAL = 3      # Mission events, regular killfeed
     LOW = 4         # Bulk operations, non-essential updates
 
+class SendResult(Enum):
+    SENT = 1
+    RATE_LIMITED = 2  # Discord returned 429, the request itself was fine
+    FAILED = 3        # Any other error, possibly caused by the message content
+
 @dataclass
 class QueuedMessage:
     channel_id: int
@@ -31,6 +36,7 @@ class QueuedMessage:
     timestamp: datetime
     retry_count: int = 0
     callback: Optional[Callable] = None
+    batchable: bool = True  # Cleared once a batch containing it fails, so it is retried alone
 
 class AdvancedRateLimiter:
     """
@@ -49,6 +55,8 @@ class AdvancedRateLimiter:
         self.GLOBAL_RATE_LIMIT = 50  # Global messages per second
         self.CHANNEL_RATE_LIMIT = 5  # Messages per channel per 5 seconds
         self.BURST_ALLOWANCE = 10   # Burst messages allowed
+        self.MAX_EMBEDS_PER_MESSAGE = 10  # Embeds Discord accepts in one message
+        self.MAX_EMBED_CHARS_PER_MESSAGE = 6000  # Combined embed text limit per message
         
         # Tracking structures
         self.channel_queues: Dict[int, List[QueuedMessage]] = defaultdict(list)
@@ -228,28 +236,37 @@ class AdvancedRateLimiter:
                 if self._is_globally_rate_limited(current_time):
                     break
                 
-                message = queue.pop(0)
-                success = await self._send_message(channel, message)
+                batch = self._take_batch(queue)
+                result = await self._send_message(channel, batch)
                 
-                if success:
-                    # Update tracking
+                if result is SendResult.SENT:
+                    # Update tracking - a batch is a single request
                     self.global_message_times.append(current_time)
                     self.channel_message_count[channel_id].append(current_time)
                     self.channel_last_sent[channel_id] = current_time
                     
-                    # Call callback if provided
-                    if message.callback:
-                        try:
-                            await message.callback()
-                        except Exception as e:
-                            logger.error(f"Callback error: {e}")
-                else:
-                    # Re-queue with increased retry count if failed
-                    message.retry_count += 1
-                    if message.retry_count < 3:
+                    # Call callbacks if provided
+                    for message in batch:
+                        if message.callback:
+                            try:
+                                await message.callback()
+                            except Exception as e:
+                                logger.error(f"Callback error: {e}")
+                elif len(batch) > 1:
+                    # Batches don't use up retries - after a non rate limit failure the
+                    # messages go out one by one so a single bad embed only costs itself
+                    for message in reversed(batch):
+                        if result is SendResult.FAILED:
+                            message.batchable = False
                         queue.insert(0, message)
-                    else:
-                        logger.error(f"Message failed after 3 retries: {message.embed.title}")
+                else:
+                    # Re-queue with increased retry count if failed, keeping queue order
+                    for message in batch:
+                        message.retry_count += 1
+                        if message.retry_count < 3:
+                            queue.insert(0, message)
+                        else:
+                            logger.error(f"Message failed after 3 retries: {message.embed.title}")
                 
                 # Small delay between messages in same channel
                 await asyncio.sleep(0.1)
@@ -259,19 +276,55 @@ class AdvancedRateLimiter:
         finally:
             self.processing_channels.discard(channel_id)
 
-    async def _send_message(self, channel, message: QueuedMessage) -> bool:
-        """Send a single message with rate limit handling"""
+    def _take_batch(self, queue: List[QueuedMessage]) -> List[QueuedMessage]:
+        """Pop the next message plus the following embed-only messages that fit in one send"""
+        batch = [queue.pop(0)]
+        if batch[0].content or not batch[0].embed or not batch[0].batchable:
+            return batch
+        
+        total_chars = len(batch[0].embed)
+        while queue and len(batch) < self.MAX_EMBEDS_PER_MESSAGE:
+            candidate = queue[0]
+            if candidate.content or not candidate.embed or not candidate.batchable:
+                break
+            candidate_chars = len(candidate.embed)
+            if total_chars + candidate_chars > self.MAX_EMBED_CHARS_PER_MESSAGE:
+                break
+            batch.append(queue.pop(0))
+            total_chars += candidate_chars
+        
+        return batch
+
+    async def _send_message(self, channel, messages: List[QueuedMessage]) -> SendResult:
+        """Send queued messages as a single request with rate limit handling"""
         try:
             kwargs = {}
-            if message.embed:
-                kwargs['embed'] = message.embed
-            if message.file:
-                kwargs['file'] = message.file
-            if message.content:
-                kwargs['content'] = message.content
+            if len(messages) == 1:
+                message = messages[0]
+                if message.embed:
+                    kwargs['embed'] = message.embed
+                if message.file:
+                    kwargs['file'] = message.file
+                if message.content:
+                    kwargs['content'] = message.content
+            else:
+                kwargs['embeds'] = [message.embed for message in messages]
+                # Embeds sharing a thumbnail asset reference one attachment by filename
+                files = {}
+                for message in messages:
+                    if message.file:
+                        files.setdefault(message.file.filename, message.file)
+                if files:
+                    kwargs['files'] = list(files.values())
+            
+            # A failed send already read the buffers to the end - rewind them so a
+            # resend doesn't upload empty attachments
+            for message in messages:
+                if message.file:
+                    message.file.reset()
             
             await channel.send(**kwargs)
-            return True
+            return SendResult.SENT
             
         except discord.HTTPException as e:
             if e.status == 429:  # Rate limited
@@ -285,13 +338,13 @@ class AdvancedRateLimiter:
                     logger.warning(f"Channel rate limit hit, waiting {retry_after}s")
                 
                 await asyncio.sleep(retry_after)
-                return False
+                return SendResult.RATE_LIMITED
             else:
                 logger.error(f"HTTP error sending message: {e}")
-                return False
+                return SendResult.FAILED
         except Exception as e:
             logger.error(f"Unexpected error sending message: {e}")
-            return False
+            return SendResult.FAILED
 
     def get_queue_stats(self) -> Dict[str, Any]:
         """Get comprehensive queue statistics"""
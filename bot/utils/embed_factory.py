@@ -4,12 +4,21 @@ Professional, esports-adjacent dark-themed formatting for all embeds
 """
 
 import discord
+import io
 import random
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
 
+@lru_cache(maxsize=None)
+def _read_asset(path: str) -> bytes:
+    """Read a bundled asset once - the files never change while the bot runs"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
 class EmbedFactory:
     """
     EMERALD EMBED FACTORY
@@ -352,6 +361,11 @@ class EmbedFactory:
         embed.add_field(name="Cause", value="Falling Damage", inline=True)
         return embed
 
+    @staticmethod
+    def asset_file(path: str, filename: str) -> discord.File:
+        """Attachment for a bundled asset, served from memory after the first read"""
+        return discord.File(io.BytesIO(_read_asset(path)), filename=filename)
+
     # The build method is replaced with the new connection embed logic and other modifications
     @staticmethod
     async def build(embed_type: str, data: Dict[str, Any]) -> Tuple[discord.Embed, Optional[discord.File]]:
@@ -389,7 +403,7 @@ class EmbedFactory:
                     inline=True
                 )
 
-                file_attachment = discord.File('assets/Connections.png', filename='connections.png')
+                file_attachment = EmbedFactory.asset_file('assets/Connections.png', 'connections.png')
                 embed.set_thumbnail(url='attachment://connections.png')
 
             elif embed_type == 'killfeed':
@@ -404,10 +418,10 @@ class EmbedFactory:
 
                 # Add killfeed icon
                 if data.get('suicide', False):
-                    file_attachment = discord.File('assets/Suicide.png', filename='suicide.png')
+                    file_attachment = EmbedFactory.asset_file('assets/Suicide.png', 'suicide.png')
                     embed.set_thumbnail(url='attachment://suicide.png')
                 else:
-                    file_attachment = discord.File('assets/Killfeed.png', filename='killfeed.png')
+                    file_attachment = EmbedFactory.asset_file('assets/Killfeed.png', 'killfeed.png')
                     embed.set_thumbnail(url='attachment://killfeed.png')
 
             elif embed_type == 'mission':
@@ -419,7 +433,7 @@ class EmbedFactory:
                     state=data.get('state', 'UNKNOWN')
                 )
 
-                file_attachment = discord.File('assets/Mission.png', filename='mission.png')
+                file_attachment = EmbedFactory.asset_file('assets/Mission.png', 'mission.png')
                 embed.set_thumbnail(url='attachment://mission.png')
 
             elif embed_type == 'airdrop':
@@ -429,7 +443,7 @@ class EmbedFactory:
                     timestamp=datetime.now(timezone.utc)
                 )
 
-                file_attachment = discord.File('assets/Airdrop.png', filename='airdrop.png')
+                file_attachment = EmbedFactory.asset_file('assets/Airdrop.png', 'airdrop.png')
                 embed.set_thumbnail(url='attachment://airdrop.png')
 
             elif embed_type == 'helicrash':
@@ -438,7 +452,7 @@ class EmbedFactory:
                     timestamp=datetime.now(timezone.utc)
                 )
 
-                file_attachment = discord.File('assets/Helicrash.png', filename='helicrash.png')
+                file_attachment = EmbedFactory.asset_file('assets/Helicrash.png', 'helicrash.png')
                 embed.set_thumbnail(url='attachment://helicrash.png')
 
             elif embed_type == 'trader':
@@ -447,7 +461,7 @@ class EmbedFactory:
                     timestamp=datetime.now(timezone.utc)
                 )
 
-                file_attachment = discord.File('assets/Trader.png', filename='trader.png')
+                file_attachment = EmbedFactory.asset_file('assets/Trader.png', 'trader.png')
                 embed.set_thumbnail(url='attachment://trader.png')
 
             # Default fallback
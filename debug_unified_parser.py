@@ -130,7 +130,7 @@ async def debug_parser():
     # Check parser file states
     print(f"\n📊 Parser State:")
     print(f"File states: {len(parser.file_states)} servers tracked")
-    print(f"Player sessions: {len(parser.player_sessions)} active sessions")
+    print(f"Player sessions: {len(parser.session_status)} active sessions")
     print(f"Last log positions: {len(parser.last_log_position)} servers")
     
     # Test actual parsing if we found any log files
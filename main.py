@@ -349,6 +349,9 @@ class EmeraldKillfeedBot(commands.Bot):
                 await self.killfeed_parser.cleanup_sftp_connections()
 
             if hasattr(self, 'unified_log_parser') and self.unified_log_parser:
+                # Persist pending parser state before shutdown
+                await self.unified_log_parser.flush_persistent_state()
+
                 # Clean up unified parser SFTP connections
                 for pool_key, conn in list(self.unified_log_parser.sftp_connections.items()):
                     try:
@@ -357,6 +360,7 @@ class EmeraldKillfeedBot(commands.Bot):
                     except:
                         pass
                 self.unified_log_parser.sftp_connections.clear()
+                self.unified_log_parser.sftp_clients.clear()
 
             logger.info("Cleaned up all SFTP connections")
 